@@ -33,6 +33,7 @@ from pomdp_py.algorithms.po_uct import (
     RandomRollout,
     ActionPrior,
 )
+from pomdp_py.algorithms.parallel_pouct import ParallelPOUCT
 from pomdp_py.algorithms.bsp.blqr import BLQR
 
 # Templates & Utilities
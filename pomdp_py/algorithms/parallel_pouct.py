@@ -0,0 +1,204 @@
+"""Parallel POUCT with virtual loss.
+
+Runs POUCT simulations concurrently on a thread pool. Each in-flight
+simulation adds a "virtual visit" to the nodes on its selection path,
+which inflates the visit counts seen by UCB so that concurrent threads
+spread over different branches instead of all diving down the current
+best one; the virtual visits are removed when the simulation
+backpropagates its real result.
+
+Tree reads and writes happen under a single lock; the generative-model
+sampling and rollouts — the bulk of each simulation — run outside it,
+so threads overlap wherever the models release the GIL (e.g. Cython or
+NumPy kernels). With pure-Python models the benefit is limited to
+hiding latency, as with any threaded Python workload.
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pomdp_py.framework.basics import sample_generative_model
+from pomdp_py.algorithms.po_uct import POUCT, QNode, VNode, RootVNode
+
+
+class ParallelPOUCT(POUCT):
+    """POUCT whose simulations run on `num_workers` threads with
+    virtual-loss UCB. Takes the same parameters as POUCT (action priors
+    are not supported), plus `num_workers`. Only `num_sims`-based
+    stopping is supported; the simulations are split evenly over the
+    workers."""
+
+    def __init__(
+        self,
+        max_depth=5,
+        num_sims=400,
+        discount_factor=0.9,
+        exploration_const=math.sqrt(2),
+        num_visits_init=0,
+        value_init=0,
+        rollout_policy=None,
+        num_workers=4,
+    ):
+        super().__init__(
+            max_depth=max_depth,
+            num_sims=num_sims,
+            discount_factor=discount_factor,
+            exploration_const=exploration_const,
+            num_visits_init=num_visits_init,
+            value_init=value_init,
+            rollout_policy=rollout_policy,
+        )
+        # POUCT's cdef fields are not writable from Python; keep the
+        # values this class needs as plain attributes.
+        self._p_max_depth = max_depth
+        self._p_num_sims = num_sims
+        self._p_discount = discount_factor
+        self._p_explore = exploration_const
+        self._p_visits_init = num_visits_init
+        self._p_value_init = value_init
+        self._num_workers = num_workers
+        self._tree_lock = threading.Lock()
+        self._virtual = {}  # id(node) -> in-flight simulation count
+        self._p_last_num_sims = -1
+        self._p_last_planning_time = -1.0
+
+    @property
+    def last_num_sims(self):
+        return self._p_last_num_sims
+
+    @property
+    def last_planning_time(self):
+        return self._p_last_planning_time
+
+    def plan(self, agent):
+        if self.rollout_policy is None:
+            raise ValueError(
+                "rollout_policy unset. Please call set_rollout_policy,"
+                " or pass in a rollout_policy upon initialization"
+            )
+        if not hasattr(agent, "tree"):
+            agent.add_attr("tree", None)
+        if agent.tree is None:
+            agent.tree = RootVNode(self._p_visits_init, agent.history)
+            self._expand(agent.tree, agent.history, None)
+        self._virtual.clear()
+
+        start_time = time.time()
+        per_worker = self._p_num_sims // self._num_workers
+        counts = [per_worker] * self._num_workers
+        counts[0] += self._p_num_sims - per_worker * self._num_workers
+        with ThreadPoolExecutor(max_workers=self._num_workers) as pool:
+            futures = [pool.submit(self._worker, agent, n) for n in counts]
+            for f in futures:
+                f.result()
+
+        self._p_last_num_sims = self._p_num_sims
+        self._p_last_planning_time = time.time() - start_time
+        return agent.tree.argmax()
+
+    def _worker(self, agent, n_sims):
+        for _ in range(n_sims):
+            with self._tree_lock:
+                state = agent.sample_belief()
+            self._simulate_vl(agent, state, agent.history, agent.tree, 0)
+
+    def _vvisits(self, node):
+        return self._virtual.get(id(node), 0)
+
+    def _ucb_vl(self, vnode):
+        """UCB1 over visit counts inflated by in-flight simulations."""
+        best_action, best_value = None, float("-inf")
+        n_parent = vnode.num_visits + self._vvisits(vnode)
+        for action in vnode.children:
+            qnode = vnode[action]
+            n = qnode.num_visits + self._vvisits(qnode)
+            if n == 0:
+                val = float("inf")
+            else:
+                val = qnode.value + self._p_explore * math.sqrt(
+                    math.log(n_parent + 1) / n
+                )
+            if val > best_value:
+                best_action, best_value = action, val
+        return best_action
+
+    def _expand(self, vnode, history, state):
+        for action in self.rollout_policy.get_all_actions(state=state, history=history):
+            if vnode[action] is None:
+                vnode[action] = QNode(self._p_visits_init, self._p_value_init)
+
+    def _simulate_vl(self, agent, state, history, root, depth):
+        """One simulation step; mirrors POUCT._simulate with virtual
+        visits held on the traversed (vnode, qnode) pair."""
+        if depth > self._p_max_depth:
+            return 0
+
+        with self._tree_lock:
+            action = self._ucb_vl(root)
+            qnode = root[action]
+            self._virtual[id(root)] = self._vvisits(root) + 1
+            self._virtual[id(qnode)] = self._vvisits(qnode) + 1
+
+        try:
+            next_state, observation, reward, nsteps = sample_generative_model(
+                agent, state, action
+            )
+            if nsteps == 0:
+                return reward
+
+            with self._tree_lock:
+                child = qnode[observation]
+                if child is None:
+                    # Leaf: expand it, then roll out below (outside the
+                    # lock); other threads see the virtual visit and
+                    # steer elsewhere meanwhile.
+                    child = VNode(self._p_visits_init)
+                    qnode[observation] = child
+                    self._expand(child, history + ((action, observation),), next_state)
+                    new_leaf = True
+                else:
+                    new_leaf = False
+
+            if new_leaf:
+                future = self._rollout_value(
+                    agent, next_state, history + ((action, observation),), depth + nsteps
+                )
+            else:
+                future = self._simulate_vl(
+                    agent,
+                    next_state,
+                    history + ((action, observation),),
+                    child,
+                    depth + nsteps,
+                )
+            total_reward = reward + (self._p_discount**nsteps) * future
+        finally:
+            with self._tree_lock:
+                self._virtual[id(root)] -= 1
+                self._virtual[id(qnode)] -= 1
+
+        with self._tree_lock:
+            root.num_visits += 1
+            qnode.num_visits += 1
+            qnode.value = qnode.value + (total_reward - qnode.value) / qnode.num_visits
+        return total_reward
+
+    def _rollout_value(self, agent, state, history, depth):
+        """Total discounted reward of a random rollout to max_depth."""
+        discount = 1.0
+        total = 0.0
+        while depth <= self._p_max_depth:
+            action = self.rollout_policy.rollout(state, history)
+            next_state, observation, reward, nsteps = sample_generative_model(
+                agent, state, action
+            )
+            history = history + ((action, observation),)
+            depth += nsteps
+            total += reward * discount
+            discount *= self._p_discount**nsteps
+            state = next_state
+            if nsteps == 0:
+                break
+        return total
@@ -0,0 +1,324 @@
+"""Cythonized version of the Maze POMDP.
+
+Problem originally introduced in `Solving POMDPs by Searching the Space of
+Finite Policies <https://arxiv.org/pdf/1301.6720.pdf>`_
+
+A partially observable stochastic maze: the agent must go from the starting
+state marked with an "S" to the goal marked with a "G". The agent cannot
+perceive its true location, only its orientation and the presence or absence
+of a wall on each side of the square defining its current state. Moves slip
+to a perpendicular direction with some probability.
+
+This mirrors the pure-Python implementation under
+``pomdp_py/problems/maze`` with the state/action/observation classes and
+the T/O/R models as typed ``cdef`` extension classes, so the ~500k model
+calls per POUCT episode run without Python attribute/dict overhead. The
+maze layout is shared with the Python version through
+:class:`MazeMap`'s packed wall-bit grid.
+"""
+from pomdp_py.framework.basics cimport *
+from pomdp_py.algorithms.po_uct cimport *
+import pomdp_py
+import random
+import numpy as np
+
+from pomdp_py.problems.maze.models.components.map import MazeMap
+
+ORIENTATIONS = ("North", "East", "South", "West")
+
+# Direction codes 0=N, 1=E, 2=S, 3=W (same encoding as domain/direction.py)
+cdef int[4] _DX = [0, 1, 0, -1]
+cdef int[4] _DY = [-1, 0, 1, 0]
+# Perpendicular (slip) codes per direction code
+cdef int[4][2] _PERP = [[1, 3], [0, 2], [1, 3], [0, 2]]
+
+# Wall-letter strings indexed by the packed wall int (N=8, E=4, S=2, W=1)
+_WALL_STR = tuple(
+    "".join("NESW"[i] if (w >> (3 - i)) & 1 else "-" for i in range(4))
+    for w in range(16)
+)
+_LOC_NAMES = (None, "Start", "Goal")
+
+
+cdef class MazeState(State):
+    cdef public int x, y, oidx
+    def __init__(self, int x, int y, int oidx):
+        self.x = x
+        self.y = y
+        self.oidx = oidx
+    @property
+    def position(self):
+        return (self.x, self.y)
+    @property
+    def orientation(self):
+        return ORIENTATIONS[self.oidx]
+    def __hash__(self):
+        return (self.x << 16) ^ (self.y << 2) ^ self.oidx
+    def __eq__(self, other):
+        if isinstance(other, MazeState):
+            return self.x == (<MazeState>other).x\
+                and self.y == (<MazeState>other).y\
+                and self.oidx == (<MazeState>other).oidx
+        return False
+    def __str__(self):
+        return repr(self)
+    def __repr__(self):
+        return "MazeState((%d, %d), %s)" % (self.x, self.y, self.orientation)
+
+
+cdef class MazeAction(Action):
+    cdef public int code
+    def __init__(self, name):
+        self.name = name
+        self.code = ORIENTATIONS.index(name)
+    def __hash__(self):
+        return self.code
+    def __eq__(self, other):
+        if isinstance(other, MazeAction):
+            return self.code == (<MazeAction>other).code
+        elif type(other) == str:
+            return self.name == other
+        return False
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return "MazeAction(%s)" % self.name
+
+
+cdef class MazeObservation(Observation):
+    """Walls around the current cell, the robot's orientation, and a
+    rule-based detection of special locations, packed into one int
+    ``code = wbits | oidx << 4 | loc << 6`` (wall bits N=8, E=4, S=2, W=1;
+    loc 0=None, 1=Start, 2=Goal)."""
+    cdef public int code
+    def __init__(self, int wbits, int oidx, int loc):
+        self.code = wbits | (oidx << 4) | (loc << 6)
+    @property
+    def walls(self):
+        cdef int w = self.code & 0xf
+        return (bool(w & 8), bool(w & 4), bool(w & 2), bool(w & 1))
+    @property
+    def orientation(self):
+        return ORIENTATIONS[(self.code >> 4) & 0x3]
+    @property
+    def location(self):
+        return _LOC_NAMES[self.code >> 6]
+    def __hash__(self):
+        return self.code
+    def __eq__(self, other):
+        if isinstance(other, MazeObservation):
+            return self.code == (<MazeObservation>other).code
+        return False
+    def __str__(self):
+        return "MazeObservation(%s, %s, %s)"\
+            % (_WALL_STR[self.code & 0xf], self.orientation, self.location)
+    def __repr__(self):
+        return str(self)
+
+
+cdef class MazeTransitionModel(TransitionModel):
+    """Moves in the intended direction with probability 1 - 2*slip_prob,
+    and slips to each perpendicular direction with probability slip_prob."""
+    cdef double slip_prob, main_prob
+    def __init__(self, double slip_prob=0.1):
+        self.slip_prob = slip_prob
+        self.main_prob = 1.0 - 2 * slip_prob
+
+    def probability(self, next_state, state, action, normalized=False, **kwargs):
+        cdef MazeState s = state
+        cdef MazeState sp = next_state
+        cdef int code = (<MazeAction>action).code
+        if sp.oidx != s.oidx:
+            return 0.0
+        if sp.x == s.x + _DX[code] and sp.y == s.y + _DY[code]:
+            return self.main_prob
+        cdef int k, d
+        for k in range(2):
+            d = _PERP[code][k]
+            if sp.x == s.x + _DX[d] and sp.y == s.y + _DY[d]:
+                return self.slip_prob
+        return 0.0
+
+    cpdef sample(self, State state, Action action):
+        cdef MazeState s = state
+        cdef int code = (<MazeAction>action).code
+        cdef double r = random.random()
+        if r >= self.main_prob:
+            if r < self.main_prob + self.slip_prob:
+                code = _PERP[code][0]
+            else:
+                code = _PERP[code][1]
+        return MazeState(s.x + _DX[code], s.y + _DY[code], s.oidx)
+
+    def get_all_states(self):
+        raise NotImplementedError("get_all_states not implemented for maze domain")
+
+
+cdef class MazeObservationModel(ObservationModel):
+    """Deterministic observation of the walls around the robot's cell,
+    its orientation, and whether the cell is the start or the goal."""
+    cdef unsigned char[:, ::1] wall_mask
+    cdef int width, height, sx, sy, gx, gy
+    def __init__(self, maze_map):
+        self.wall_mask = np.ascontiguousarray(maze_map._wall_mask)
+        self.height = self.wall_mask.shape[0]
+        self.width = self.wall_mask.shape[1]
+        self.sx, self.sy = maze_map.start
+        self.gx, self.gy = maze_map.goal
+
+    def probability(self, observation, next_state, action, normalized=False, **kwargs):
+        cdef MazeObservation expected = self.sample(next_state, action)
+        return 1.0 if (<MazeObservation>observation).code == expected.code else 0.0
+
+    cpdef sample(self, State next_state, Action action):
+        cdef MazeState s = next_state
+        cdef int m = 0, wbits, loc
+        if 0 <= s.y < self.height and 0 <= s.x < self.width:
+            m = self.wall_mask[s.y, s.x]
+        # MazeMap packs N=1, E=2, S=4, W=8; the observation code uses
+        # N=8, E=4, S=2, W=1
+        wbits = ((m & 1) << 3) | ((m & 2) << 1) | ((m & 4) >> 1) | ((m & 8) >> 3)
+        if s.x == self.gx and s.y == self.gy:
+            loc = 2
+        elif s.x == self.sx and s.y == self.sy:
+            loc = 1
+        else:
+            loc = 0
+        return MazeObservation(wbits, s.oidx, loc)
+
+    def get_all_observations(self):
+        raise NotImplementedError("get_all_observations not implemented for maze domain")
+
+
+cdef class MazeRewardModel(RewardModel):
+    """+goal_reward at the goal, -wall_penalty when the position did not
+    change, -step_penalty otherwise."""
+    cdef int gx, gy
+    cdef double gr, sp, wp
+    def __init__(self, maze_map, double goal_reward=10,
+                 double step_penalty=1, double wall_penalty=5):
+        self.gx, self.gy = maze_map.goal
+        self.gr = goal_reward
+        self.sp = -step_penalty
+        self.wp = -wall_penalty
+
+    cpdef _reward_func(self, MazeState state, MazeState next_state):
+        if next_state.x == self.gx and next_state.y == self.gy:
+            return self.gr
+        if next_state.x == state.x and next_state.y == state.y:
+            return self.wp
+        return self.sp
+
+    def probability(self, reward, state, action, next_state, normalized=False):
+        return 1.0 if reward == self._reward_func(state, next_state) else 0.0
+
+    cpdef sample(self, State state, Action action, State next_state):
+        return self._reward_func(state, next_state)
+
+
+cdef class MazePolicyModel(RolloutPolicy):
+    """Uniform random over the four move actions."""
+    cdef tuple _all_actions
+    def __init__(self):
+        self._all_actions = tuple(MazeAction(name) for name in ORIENTATIONS)
+
+    def probability(self, action, state, normalized=False, **kwargs):
+        return 1.0 / 4
+
+    def sample(self, state, normalized=False, **kwargs):
+        return self._all_actions[random.randrange(4)]
+
+    def get_all_actions(self, state=None, history=None):
+        return self._all_actions
+
+    cpdef Action rollout(self, State state, tuple history):
+        return self._all_actions[random.randrange(4)]
+
+
+cdef class MazeProblem(POMDP):
+
+    cdef public object maze_map
+    # Start/goal as typed ints so hot loops compare coordinates without
+    # touching the maze_map object or allocating position tuples
+    cdef readonly int start_x, start_y, goal_x, goal_y
+
+    def __init__(self, maze_map, init_state, init_belief,
+                 slip_prob=0.1, goal_reward=10, step_penalty=1, wall_penalty=5):
+        """init_belief is a Distribution."""
+        transition_model = MazeTransitionModel(slip_prob)
+        reward_model = MazeRewardModel(maze_map, goal_reward=goal_reward,
+                                       step_penalty=step_penalty,
+                                       wall_penalty=wall_penalty)
+        agent = Agent(init_belief,
+                      MazePolicyModel(),
+                      transition_model,
+                      MazeObservationModel(maze_map),
+                      reward_model)
+        env = Environment(init_state, transition_model, reward_model)
+        self.maze_map = maze_map
+        self.start_x, self.start_y = maze_map.start
+        self.goal_x, self.goal_y = maze_map.goal
+        super().__init__(agent, env, name="Maze")
+
+    @staticmethod
+    def create(maze_map=None, **kwargs):
+        """Create a MazeProblem on the example maze with a uniform belief
+        over the start orientations (same defaults as the Python version)."""
+        if maze_map is None:
+            maze_map = MazeMap.create_example_maze()
+        sx, sy = maze_map.start
+        init_state = MazeState(sx, sy, 0)
+        init_belief = pomdp_py.Histogram(
+            {MazeState(sx, sy, oidx): 0.25 for oidx in range(4)})
+        return MazeProblem(maze_map, init_state, init_belief, **kwargs)
+
+
+def solve(MazeProblem maze_problem, planner, max_steps=50):
+    """Runs the action-feedback loop of the maze problem POMDP."""
+    cdef int goal_x = maze_problem.goal_x
+    cdef int goal_y = maze_problem.goal_y
+    cdef MazeState next_state
+    total_reward = 0
+    for step in range(max_steps):
+        real_action = planner.plan(maze_problem.agent)
+
+        current_state = maze_problem.env.state
+        next_state = maze_problem.env.transition_model.sample(
+            current_state, real_action)
+        reward = maze_problem.env.reward_model.sample(
+            current_state, real_action, next_state)
+        total_reward += reward
+        maze_problem.env.apply_transition(next_state)
+
+        real_observation = maze_problem.agent.observation_model.sample(
+            next_state, real_action)
+        maze_problem.agent.update_history(real_action, real_observation)
+        planner.update(maze_problem.agent, real_action, real_observation)
+
+        print("==== Step %d ====" % (step + 1))
+        print("True state: %s" % str(next_state))
+        print("Action: %s" % str(real_action))
+        print("Observation: %s" % str(real_observation))
+        print("Reward: %s" % str(reward))
+        print("Cumulative Reward: %s" % str(total_reward))
+        if isinstance(planner, POUCT):
+            print("Num sims: %d" % planner.last_num_sims)
+            print("Plan time: %.5f" % planner.last_planning_time)
+
+        if next_state.x == goal_x and next_state.y == goal_y:
+            print("Goal reached!")
+            break
+    print("Episode complete. Total reward: %s" % total_reward)
+
+
+def main():
+    maze = MazeProblem.create()
+    print("\n** Testing POUCT **")
+    pouct = POUCT(max_depth=10, discount_factor=0.95,
+                  num_sims=1000, exploration_const=50,
+                  rollout_policy=maze.agent.policy_model)
+    solve(maze, pouct, max_steps=50)
+
+
+if __name__ == "__main__":
+    main()
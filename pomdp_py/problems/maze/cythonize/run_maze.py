@@ -0,0 +1,4 @@
+from maze_problem import main
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """Domain definitions for the Maze POMDP"""
 
-from pomdp_py.problems.maze.domain.state import State
+from pomdp_py.problems.maze.domain.state import State, get_state
 from pomdp_py.problems.maze.domain.action import (
     MazeAction,
     MoveNorth,
@@ -10,9 +10,12 @@ from pomdp_py.problems.maze.domain.action import (
     get_all_actions,
 )
 from pomdp_py.problems.maze.domain.observation import Observation, WALL_NAMES
+from pomdp_py.problems.maze.domain.direction import Direction
 
 __all__ = [
+    "Direction",
     "State",
+    "get_state",
     "MazeAction",
     "MoveNorth",
     "MoveSouth",
@@ -4,20 +4,31 @@ The agent can move North, East, South, or West.
 """
 
 import pomdp_py
+from pomdp_py.problems.maze.domain.direction import DIR_CODE
 
 
 class MazeAction(pomdp_py.Action):
     """Base class for maze navigation actions"""
 
+    __slots__ = ("name", "code", "_hash")
+
     def __init__(self, name):
         self.name = name
+        # Integer direction code (0=N, 1=E, 2=S, 3=W) used by the models
+        # to index precomputed direction arrays
+        self.code = DIR_CODE[name]
+        # Actions are dict keys in the planners' Q-tables; cache the hash
+        # so __hash__ is an attribute load instead of rehashing the name.
+        self._hash = hash(name)
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
     def __eq__(self, other):
         if isinstance(other, MazeAction):
-            return self.name == other.name
+            # Comparing the int codes is cheaper than the names; actions
+            # are dict keys in the UCB child-selection loop.
+            return self.code == other.code
         elif isinstance(other, str):
             return self.name == other
         return False
@@ -31,26 +42,45 @@ class MazeAction(pomdp_py.Action):
 
 # Specific navigation actions
 class MoveNorth(MazeAction):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("North")
 
 
 class MoveSouth(MazeAction):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("South")
 
 
 class MoveEast(MazeAction):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("East")
 
 
 class MoveWest(MazeAction):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("West")
 
 
+# Module-level singletons; actions are value-typed (only `name`), so one
+# instance per direction suffices. Planners call get_all_actions() per
+# tree-node expansion, so returning a prebuilt tuple avoids re-allocating
+# four actions on every call.
+NORTH = MoveNorth()
+SOUTH = MoveSouth()
+EAST = MoveEast()
+WEST = MoveWest()
+ALL_ACTIONS = (NORTH, SOUTH, EAST, WEST)
+
+
 # Convenience function to get all actions
 def get_all_actions():
     """Returns all possible navigation actions"""
-    return [MoveNorth(), MoveSouth(), MoveEast(), MoveWest()]
+    return ALL_ACTIONS
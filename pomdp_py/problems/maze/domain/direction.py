@@ -0,0 +1,33 @@
+"""
+Integer direction codes shared across the maze domain and models.
+
+Directions are encoded as small ints (0=North, 1=East, 2=South, 3=West),
+matching the State orientation indices, so the hot model paths index
+precomputed arrays instead of hashing direction strings.
+"""
+
+from enum import IntEnum
+
+import numpy as np
+
+
+class Direction(IntEnum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+
+# Direction name -> code (the inverse of DIR_NAMES)
+DIR_CODE = {"North": 0, "East": 1, "South": 2, "West": 3}
+DIR_NAMES = ("North", "East", "South", "West")
+
+# Unit (x, y) grid deltas per direction code; y grows southward
+DX = np.array([0, 1, 0, -1], dtype=np.int8)
+DY = np.array([-1, 0, 1, 0], dtype=np.int8)
+
+# The two perpendicular (slip) direction codes per direction code
+PERP = np.array([[1, 3], [0, 2], [1, 3], [0, 2]], dtype=np.int8)
+
+# Wall bit per direction code (matches MazeMap DIR_BIT: N=1, E=2, S=4, W=8)
+WALL_BITS = np.array([1, 2, 4, 8], dtype=np.uint8)
@@ -1,9 +1,60 @@
 import pomdp_py
+from pomdp_py.problems.maze.domain.state import ORIENTATIONS, _ORIENT_IDX
 
 
 # Wall indices in clockwise fashion: 0=North, 1=East, 2=South, 3=West
 WALL_NAMES = {0: "North", 1: "East", 2: "South", 3: "West"}
 
+# Wall-letter strings ("NESW" with "-" for open sides) indexed by the
+# packed 4-bit wall int, so __str__ is a single table lookup.
+_WALL_STR_TABLE = tuple(
+    "".join("NESW"[i] if (w >> (3 - i)) & 1 else "-" for i in range(4))
+    for w in range(16)
+)
+
+# Location codes for the packed observation int
+_LOC_CODE = {None: 0, "Start": 1, "Goal": 2}
+
+# Flyweight cache of interned observations, keyed by the packed int
+# code. There are only 2^4 wall configurations x 4 orientations x a few
+# locations, so every distinct observation is built exactly once;
+# repeated sampling during belief updates returns the cached instance,
+# making equality an identity check and hashing an attribute read.
+_OBS_CACHE = {}
+
+
+def rotate_walls(packed_walls, oidx):
+    """Rotate a packed wall nibble into the robot's egocentric frame.
+
+    `packed_walls` uses the absolute N=8, E=4, S=2, W=1 packing; the
+    result packs (front=8, right=4, back=2, left=1) for a robot whose
+    heading is orientation index `oidx`. A branchless nibble rotation,
+    so it also vectorizes over NumPy arrays.
+    """
+    return ((packed_walls << oidx) | (packed_walls >> (4 - oidx))) & 0xF
+
+
+def observation_is_goal(packed_walls, oidx):
+    """Packed-int form of :meth:`Observation.is_goal`.
+
+    Operates on the 4-bit wall int and orientation index directly, so it
+    also vectorizes over NumPy arrays — useful when reweighting whole
+    particle sets without materializing Observation objects.
+    """
+    return (
+        (oidx == 2) & ((packed_walls & 0b1101) == 0b1101) & ((packed_walls & 0b0010) == 0)
+    )
+
+
+def observation_is_start(packed_walls, oidx):
+    """Packed-int form of :meth:`Observation.is_start`.
+
+    Like :func:`observation_is_goal`, works on scalars or NumPy arrays.
+    """
+    return (
+        (oidx == 0) & ((packed_walls & 0b0110) == 0b0110) & ((packed_walls & 0b1001) == 0)
+    )
+
 
 class Observation(pomdp_py.Observation):
     """
@@ -11,9 +62,18 @@ class Observation(pomdp_py.Observation):
     - walls: tuple of 4 booleans indicating walls on (North, East, South, West)
     - orientation: string indicating robot's orientation (North, East, South, West)
     - location: rule-based detection of special locations ("Start", "Goal", or None)
+
+    Observations are interned: constructing one with the same walls,
+    orientation and location returns the same instance. The wall booleans
+    are packed into a 4-bit int `_wbits` (N=8, E=4, S=2, W=1) used by the
+    rule-based location predicates, and the whole observation into a
+    single int `_code = wbits | oidx << 4 | loc << 6`, so hashing and
+    equality are plain int operations.
     """
 
-    def __init__(self, walls, orientation, location=None):
+    __slots__ = ("walls", "_wbits", "_oidx", "location", "_code")
+
+    def __new__(cls, walls, orientation, location=None):
         """
         Args:
             walls (tuple): 4-tuple of booleans indicating walls on (N, E, S, W)
@@ -22,53 +82,72 @@ class Observation(pomdp_py.Observation):
         """
         if not isinstance(walls, (tuple, list)) or len(walls) != 4:
             raise ValueError("walls must be a tuple/list of 4 booleans")
-        if orientation not in ["North", "East", "South", "West"]:
+        if orientation not in _ORIENT_IDX:
             raise ValueError(f"Invalid orientation: {orientation}")
-        
-        self.walls = tuple(walls)
-        self.orientation = orientation
-        self.location = location
+
+        wbits = (
+            (bool(walls[0]) << 3)
+            | (bool(walls[1]) << 2)
+            | (bool(walls[2]) << 1)
+            | bool(walls[3])
+        )
+        oidx = _ORIENT_IDX[orientation]
+        code = wbits | (oidx << 4) | (_LOC_CODE[location] << 6)
+        obs = _OBS_CACHE.get(code)
+        if obs is None:
+            obs = super().__new__(cls)
+            obs.walls = (bool(walls[0]), bool(walls[1]), bool(walls[2]), bool(walls[3]))
+            obs._wbits = wbits
+            obs._oidx = oidx
+            obs.location = location
+            obs._code = code
+            _OBS_CACHE[code] = obs
+        return obs
+
+    def __init__(self, walls, orientation, location=None):
+        # All attributes are set in __new__ so that cached instances are
+        # not re-initialized.
+        pass
+
+    @property
+    def orientation(self):
+        """Orientation as a string ("North", "East", "South", or "West")"""
+        return ORIENTATIONS[self._oidx]
+
+    def egocentric_walls(self):
+        """Packed wall nibble rotated into the robot's frame
+        (front=8, right=4, back=2, left=1)."""
+        return rotate_walls(self._wbits, self._oidx)
 
     def is_goal(self):
         """Rule-based detection: Goal is when entered via South with walls on N, E, W"""
         # Goal detected when: entered from South + walls on North, East, West
-        return (
-            self.orientation == "South"
-            and self.walls[0]  # North wall
-            and self.walls[1]  # East wall
-            and not self.walls[2]  # No South wall (entered from there)
-            and self.walls[3]  # West wall
-        )
+        # (single bitmask test on the packed wall int)
+        return observation_is_goal(self._wbits, self._oidx)
 
     def is_start(self):
         """Rule-based detection: Start is when robot is at starting position
         Based on specific wall configuration at (5, 6) in the example maze"""
-        # Start detected by characteristic wall pattern
-        # Adjust these rules based on your specific maze layout
-        return (
-            self.orientation == "North"
-            and self.walls[1]  # East wall
-            and self.walls[2]  # South wall
-            and not self.walls[0]  # No North wall
-            and not self.walls[3]  # No West wall
-        )
+        # Start detected by characteristic wall pattern: facing North with
+        # walls on East and South only
+        return observation_is_start(self._wbits, self._oidx)
 
     def __hash__(self):
-        return hash((self.walls, self.orientation, self.location))
+        return self._code
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Observation):
             return False
-        return (
-            self.walls == other.walls
-            and self.orientation == other.orientation
-            and self.location == other.location
-        )
+        return self._code == other._code
+
+    def __reduce__(self):
+        # Route unpickling through __new__ so instances stay interned
+        return (Observation, (self.walls, self.orientation, self.location))
 
     def __str__(self):
-        wall_str = "".join(
-            [WALL_NAMES[i][0] if self.walls[i] else "-" for i in range(4)]
-        )
+        wall_str = _WALL_STR_TABLE[self._wbits]
         return f"Observation({wall_str}, {self.orientation}, {self.location})"
 
     def __repr__(self):
@@ -2,13 +2,20 @@
 """
 
 import pomdp_py
-import numpy as np
+
+# Orientation names indexed by the internal integer codes 0..3
+ORIENTATIONS = ("North", "East", "South", "West")
+_ORIENT_IDX = {"North": 0, "East": 1, "South": 2, "West": 3}
 
 
 class State(pomdp_py.State):
     """The state of the maze problem is the robot's position and orientation."""
 
-    ORIENTATIONS = ["North", "East", "South", "West"]  # 0, 1, 2, 3
+    # States are created by the millions during rollouts and stored in
+    # belief sets; slots avoid a per-instance __dict__.
+    __slots__ = ("position", "_oidx", "_hash")
+
+    ORIENTATIONS = ORIENTATIONS  # 0, 1, 2, 3
 
     def __init__(self, position, orientation):
         """
@@ -22,25 +29,37 @@ class State(pomdp_py.State):
         if len(position) != 2:
             raise ValueError("State position must be a tuple of length 2")
         self.position = position
-        
-        # Normalize orientation
+
+        # Normalize orientation to a small int index; states are constructed
+        # and hashed constantly during planner rollouts, so hashing and
+        # comparing ints instead of strings matters. The string form is
+        # derived lazily through the `orientation` property.
         if isinstance(orientation, str):
-            if orientation not in self.ORIENTATIONS:
+            if orientation not in _ORIENT_IDX:
                 raise ValueError(f"Invalid orientation: {orientation}")
-            self.orientation = orientation
+            self._oidx = _ORIENT_IDX[orientation]
         elif isinstance(orientation, int):
-            if orientation not in [0, 1, 2, 3]:
+            if not 0 <= orientation < 4:
                 raise ValueError(f"Invalid orientation index: {orientation}")
-            self.orientation = self.ORIENTATIONS[orientation]
+            self._oidx = orientation
         else:
             raise ValueError("Orientation must be a string or int")
 
+        # States are dict keys in belief histograms and particle sets;
+        # hash once here so __hash__ is an attribute load.
+        self._hash = hash((position, self._oidx))
+
+    @property
+    def orientation(self):
+        """Orientation as a string ("North", "East", "South", or "West")"""
+        return ORIENTATIONS[self._oidx]
+
     def __hash__(self):
-        return hash((self.position, self.orientation))
+        return self._hash
 
     def __eq__(self, other):
         if isinstance(other, State):
-            return self.position == other.position and self.orientation == other.orientation
+            return self.position == other.position and self._oidx == other._oidx
         else:
             return False
 
@@ -49,3 +68,24 @@ class State(pomdp_py.State):
 
     def __repr__(self):
         return "State(%s, %s)" % (str(self.position), self.orientation)
+
+
+# Flyweight pool of states. A maze has only ~W*H*4 distinct states but
+# the transition model materializes them millions of times during
+# planner rollouts; interning them avoids the allocator churn and makes
+# repeated belief-set hashing hit identical objects.
+_STATE_POOL = {}
+
+
+def get_state(position, orientation):
+    """
+    Return the pooled State for (position, orientation), creating it on
+    first use. `orientation` may be a name or an int code, same as the
+    State constructor.
+    """
+    oidx = orientation if isinstance(orientation, int) else _ORIENT_IDX[orientation]
+    key = (position, oidx)
+    state = _STATE_POOL.get(key)
+    if state is None:
+        state = _STATE_POOL.setdefault(key, State(position, oidx))
+    return state
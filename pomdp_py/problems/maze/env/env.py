@@ -18,27 +18,44 @@ class MazeEnvironment(pomdp_py.Environment):
         super().__init__(init_state, transition_model, reward_model)
         self.maze_map = maze_map
 
+    def peek_transition(self, action):
+        """
+        Sample a transition without changing the environment state.
+
+        Returns both the reward and the sampled next state, so callers
+        that evaluate an action before committing to it can apply the
+        same sample via :meth:`commit_state` instead of paying for a
+        second `transition_model.sample` call.
+
+        Args:
+            action: Action to evaluate
+
+        Returns:
+            tuple: (reward, next_state)
+        """
+        next_state = self.transition_model.sample(self.state, action)
+        reward = self.reward_model.sample(self.state, action, next_state)
+        return reward, next_state
+
+    def commit_state(self, next_state):
+        """
+        Set the environment state to a previously sampled next state
+        (typically obtained from :meth:`peek_transition`).
+        """
+        self.apply_transition(next_state)
+
     def state_transition(self, action, execute=True):
         """
         Execute an action in the environment and return the reward.
-        
+
         Args:
             action: Action to execute
             execute: If True, updates the environment state
-            
+
         Returns:
             reward: Reward from the transition
         """
+        reward, next_state = self.peek_transition(action)
         if execute:
-            # Sample next state from transition model
-            next_state = self.transition_model.sample(self.state, action)
-            # Get reward
-            reward = self.reward_model.sample(self.state, action, next_state)
-            # Update state
-            self.state = next_state
-            return reward
-        else:
-            # Just compute reward without updating
-            next_state = self.transition_model.sample(self.state, action)
-            reward = self.reward_model.sample(self.state, action, next_state)
-            return reward
+            self.commit_state(next_state)
+        return reward
@@ -14,12 +14,35 @@ Run with:
 """
 
 import pygame
-import math
 import numpy as np
+from collections import OrderedDict
 from pomdp_py.problems.maze.domain.state import State
-from pomdp_py.problems.maze.domain.action import get_all_actions
+from pomdp_py.problems.maze.domain.action import (
+    get_all_actions,
+    NORTH,
+    SOUTH,
+    EAST,
+    WEST,
+)
 import pomdp_py
 
+# Unit screen-space offsets of the robot heading indicator per
+# orientation (replaces per-frame sin/cos on one of four fixed angles)
+_ORIENT_DXDY = {
+    "North": (0, -1),
+    "East": (1, 0),
+    "South": (0, 1),
+    "West": (-1, 0),
+}
+
+# Keyboard action names mapped to the module-level action singletons
+ACTION_MAP = {
+    "North": NORTH,
+    "South": SOUTH,
+    "East": EAST,
+    "West": WEST,
+}
+
 
 class MazeViz:
     """Pygame-based visualization for the Maze POMDP"""
@@ -43,14 +66,32 @@ class MazeViz:
         # Calculate display size based on maze bounds
         maze_map = maze.maze_map
         # walls format: direction -> list of [(x1,y1), (x2,y2)] segments
-        all_points = []
-        for segments in maze_map.walls.values():
-            for segment in segments:
-                for point in segment:
-                    all_points.append(point)
-        
-        self.width = max(p[0] for p in all_points) + 2 if all_points else 12
-        self.height = max(p[1] for p in all_points) + 2 if all_points else 8
+        # Flatten all segment endpoints into one (N, 2) array and reduce in
+        # C instead of iterating points in Python.
+        pts = np.fromiter(
+            (
+                coord
+                for segments in maze_map.walls.values()
+                for segment in segments
+                for point in segment
+                for coord in point
+            ),
+            dtype=np.int32,
+        ).reshape(-1, 2)
+
+        if pts.size > 0:
+            self.width = int(pts[:, 0].max()) + 2
+            self.height = int(pts[:, 1].max()) + 2
+        else:
+            self.width = 12
+            self.height = 8
+
+        # Flat (N, 4) array of wall segments as (x1, y1, x2, y2) rows,
+        # transformed to screen space in one vectorized expression; the
+        # dict-of-lists is only walked once, here.
+        self._wall_xy = pts.reshape(-1, 4)
+        r = cell_size
+        self._wall_screen = self._wall_xy * r + r // 2
 
         self.img_width = self.width * cell_size
         self.img_height = self.height * cell_size
@@ -61,18 +102,49 @@ class MazeViz:
         self._last_belief = None
         self._step_count = 0
 
+        # Cached belief-draw callable; resolved lazily from the belief type
+        # and invalidated on update() so on_render avoids per-frame hasattr
+        # checks.
+        self._draw_belief = None
+
     def on_init(self):
         """Initialize pygame"""
         pygame.init()
+        # Cache the display size instead of asking the surface each time
+        self._surf_size = (self.img_width + 200, self.img_height)
         self._display_surf = pygame.display.set_mode(
-            (self.img_width + 200, self.img_height), pygame.HWSURFACE
+            self._surf_size, pygame.HWSURFACE
         )
         pygame.display.set_caption("Maze POMDP - Navigation")
-        self._background = pygame.Surface(self._display_surf.get_size()).convert()
+        self._background = pygame.Surface(self._surf_size).convert()
+        # The grid and walls are static, so rasterize them once onto a
+        # cached surface; each frame then starts from a single blit
+        # instead of re-issuing one draw call per cell and wall.
+        self._static_bg = pygame.Surface(self._surf_size).convert()
+        self._static_bg.fill((240, 240, 240))
+        self._draw_maze(self._static_bg)
         self._clock = pygame.time.Clock()
         self._myfont = pygame.font.SysFont("Arial", 20)
+        self._text_cache = OrderedDict()
         self.running = True
 
+    def _text(self, s):
+        """Return the rendered Surface for a string, caching the result.
+
+        Most info-panel strings only change when the state changes, not
+        every frame; caching avoids re-rasterizing the same text on each
+        render tick. The cache is LRU-capped.
+        """
+        surface = self._text_cache.get(s)
+        if surface is None:
+            surface = self._myfont.render(s, True, (0, 0, 0))
+            self._text_cache[s] = surface
+            if len(self._text_cache) > 128:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(s)
+        return surface
+
     def on_event(self, event):
         """Handle pygame events"""
         if event.type == pygame.QUIT:
@@ -95,21 +167,7 @@ class MazeViz:
 
             if action is not None:
                 # Execute action in environment
-                from pomdp_py.problems.maze.domain.action import (
-                    MoveNorth,
-                    MoveSouth,
-                    MoveEast,
-                    MoveWest,
-                )
-
-                action_map = {
-                    "North": MoveNorth(),
-                    "South": MoveSouth(),
-                    "East": MoveEast(),
-                    "West": MoveWest(),
-                }
-
-                maze_action = action_map[action]
+                maze_action = ACTION_MAP[action]
                 reward = self.maze.env.state_transition(maze_action, execute=True)
                 observation = self.maze.agent.observation_model.sample(
                     self.maze.env.state, maze_action
@@ -122,11 +180,8 @@ class MazeViz:
 
     def on_render(self):
         """Render the maze visualization"""
-        # Clear background
-        self._background.fill((240, 240, 240))
-
-        # Draw maze
-        self._draw_maze()
+        # Start from the cached static background (grid + walls)
+        self._background.blit(self._static_bg, (0, 0))
 
         # Draw goal
         self._draw_point(
@@ -139,10 +194,10 @@ class MazeViz:
         )
 
         # Draw belief (if histogram or particles)
-        if hasattr(self.maze.agent.cur_belief, "get_histogram"):
-            self._draw_belief_histogram()
-        elif hasattr(self.maze.agent.cur_belief, "_particles"):
-            self._draw_belief_particles()
+        if self._draw_belief is None:
+            self._resolve_belief_drawer()
+        if self._draw_belief:
+            self._draw_belief()
 
         # Draw true robot position (red circle)
         true_pos = self.maze.env.state.position
@@ -152,38 +207,31 @@ class MazeViz:
         self._draw_info_panel()
 
         # Update display
-        pygame.transform.scale(
-            self._background,
-            (self.img_width + 200, self.img_height),
-        )
         self._display_surf.blit(self._background, (0, 0))
         pygame.display.flip()
 
-    def _draw_maze(self):
-        """Draw maze walls"""
-        maze_map = self.maze.maze_map
+    def _draw_maze(self, surface):
+        """Draw maze walls onto the given surface (called once at init)"""
         r = self.cell_size
 
         # Draw grid
         for x in range(self.width):
             for y in range(self.height):
                 pygame.draw.rect(
-                    self._background,
+                    surface,
                     (200, 200, 200),
                     (y * r, x * r, r, r),
                     1,
                 )
 
-        # Draw walls
+        # Draw walls from the precomputed screen-space segment array
         wall_color = (50, 50, 50)
         wall_thickness = 3
 
-        for direction in ["North", "East", "South", "West"]:
-            for segment in maze_map.walls.get(direction, []):
-                (x1, y1), (x2, y2) = segment
-                start = (y1 * r + r // 2, x1 * r + r // 2)
-                end = (y2 * r + r // 2, x2 * r + r // 2)
-                pygame.draw.line(self._background, wall_color, start, end, wall_thickness)
+        for x1, y1, x2, y2 in self._wall_screen:
+            pygame.draw.line(
+                surface, wall_color, (y1, x1), (y2, x2), wall_thickness
+            )
 
     def _draw_point(self, position, color, label="", size=15):
         """Draw a point (goal, start, etc.)"""
@@ -194,7 +242,7 @@ class MazeViz:
 
         # Draw label
         if label:
-            text = self._myfont.render(label, True, (0, 0, 0))
+            text = self._text(label)
             self._background.blit(
                 text,
                 (center[0] - text.get_width() // 2, center[1] - text.get_height() // 2),
@@ -209,18 +257,34 @@ class MazeViz:
         # Draw circle
         pygame.draw.circle(self._background, (255, 0, 0), center, size, 2)
 
-        # Draw orientation indicator
-        orientation_map = {"North": 0, "East": 90, "South": 180, "West": 270}
-        angle = math.radians(orientation_map.get(orientation, 0))
-        endpoint = (
-            center[0] + int(size * math.cos(angle - math.pi / 2)),
-            center[1] + int(size * math.sin(angle - math.pi / 2)),
-        )
+        # Draw orientation indicator from the precomputed direction table
+        dx, dy = _ORIENT_DXDY.get(orientation, (0, -1))
+        endpoint = (center[0] + size * dx, center[1] + size * dy)
         pygame.draw.line(self._background, (255, 0, 0), center, endpoint, 2)
 
+    def _resolve_belief_drawer(self):
+        """Bind the belief-draw callable matching the current belief type.
+
+        Resolved once per belief change (invalidated in update()) so
+        on_render does not repeat hasattr checks every frame. `False`
+        marks a belief with no known drawer.
+        """
+        belief = self.maze.agent.cur_belief
+        if hasattr(belief, "get_histogram"):
+            self._draw_belief = self._draw_belief_histogram
+        elif hasattr(belief, "positions"):
+            # Struct-of-Arrays particle belief (ParticleBeliefSoA)
+            self._draw_belief = self._draw_belief_particles_soa
+        elif hasattr(belief, "_particles"):
+            self._draw_belief = self._draw_belief_particles
+        else:
+            self._draw_belief = False
+
     def _draw_belief_histogram(self):
         """Draw belief as histogram (overlapping particles)"""
         histogram = self.maze.agent.cur_belief.get_histogram()
+        if not histogram:
+            return
 
         r = self.cell_size
         colors = [
@@ -229,29 +293,74 @@ class MazeViz:
             (0, 0, 200),  # Dark blue
         ]
 
-        # Draw top probability states
-        sorted_states = sorted(histogram.items(), key=lambda x: x[1], reverse=True)
-        for idx, (state, prob) in enumerate(sorted_states[:10]):
-            if prob < 0.01:  # Skip very low probability states
+        # Select the top probability states in O(N) with argpartition
+        # instead of a full Python sort, and compute all radii with one
+        # vectorized sqrt.
+        states = list(histogram.keys())
+        probs = np.fromiter(histogram.values(), dtype=np.float64, count=len(states))
+        k = min(10, len(states))
+        if k < len(states):
+            top_idx = np.argpartition(-probs, k - 1)[:k]
+        else:
+            top_idx = np.arange(k)
+        top_idx = top_idx[np.argsort(-probs[top_idx])]
+        radii = np.maximum(2, (5 * np.sqrt(probs[top_idx])).astype(np.int32))
+
+        for rank, i in enumerate(top_idx):
+            if probs[i] < 0.01:  # Skip very low probability states
                 continue
 
-            x, y = state.position
+            x, y = states[i].position
             center = (y * r + r // 2, x * r + r // 2)
-            radius = max(2, int(5 * math.sqrt(prob)))
-            color = colors[idx % len(colors)]
+            color = colors[rank % len(colors)]
 
-            pygame.draw.circle(self._background, color, center, radius)
+            pygame.draw.circle(self._background, color, center, int(radii[rank]))
 
     def _draw_belief_particles(self):
         """Draw belief as particles"""
         particles = self.maze.agent.cur_belief._particles
+        if not particles:
+            return
 
         r = self.cell_size
+        n = len(particles)
 
-        for particle in particles:
-            x, y = particle.position
-            center = (y * r + r // 2, x * r + r // 2)
-            pygame.draw.circle(self._background, (0, 100, 255), center, 2)
+        # Batch all particle dots into fancy-indexed pixel writes on a
+        # NumPy view of the surface, instead of one draw.circle call per
+        # particle.
+        xs = np.fromiter(
+            (p.position[1] * r + r // 2 for p in particles), dtype=np.intp, count=n
+        )
+        ys = np.fromiter(
+            (p.position[0] * r + r // 2 for p in particles), dtype=np.intp, count=n
+        )
+
+        self._blit_particle_dots(xs, ys)
+
+    def _draw_belief_particles_soa(self):
+        """Draw a Struct-of-Arrays particle belief (ParticleBeliefSoA)"""
+        belief = self.maze.agent.cur_belief
+        if len(belief) == 0:
+            return
+
+        r = self.cell_size
+        # positions are already a contiguous (N, 2) array; no per-particle
+        # attribute lookups needed
+        xs = belief.positions[:, 1].astype(np.intp) * r + r // 2
+        ys = belief.positions[:, 0].astype(np.intp) * r + r // 2
+        self._blit_particle_dots(xs, ys)
+
+    def _blit_particle_dots(self, xs, ys):
+        """Write particle dots at the given screen coordinates"""
+        arr = pygame.surfarray.pixels3d(self._background)
+        w, h = arr.shape[0], arr.shape[1]
+        # Widen each dot to a 2x2 block so particles stay visible
+        for dx in (0, 1):
+            for dy in (0, 1):
+                px = np.clip(xs + dx, 0, w - 1)
+                py = np.clip(ys + dy, 0, h - 1)
+                arr[px, py] = (0, 100, 255)
+        del arr  # release the surface lock
 
     def _draw_info_panel(self):
         """Draw information panel on the right"""
@@ -260,50 +369,40 @@ class MazeViz:
         line_height = 25
 
         # Title
-        title = self._myfont.render("Maze POMDP", True, (0, 0, 0))
+        title = self._text("Maze POMDP")
         self._background.blit(title, (panel_x, panel_y))
         panel_y += line_height
 
         # Current state
-        state_text = self._myfont.render(
-            f"Position: {self.maze.env.state.position}", True, (0, 0, 0)
-        )
+        state_text = self._text(f"Position: {self.maze.env.state.position}")
         self._background.blit(state_text, (panel_x, panel_y))
         panel_y += line_height
 
         # Orientation
-        orient_text = self._myfont.render(
-            f"Orientation: {self.maze.env.state.orientation}", True, (0, 0, 0)
-        )
+        orient_text = self._text(f"Orientation: {self.maze.env.state.orientation}")
         self._background.blit(orient_text, (panel_x, panel_y))
         panel_y += line_height
 
         # Last action
         if self._last_action:
-            action_text = self._myfont.render(
-                f"Last Action: {self._last_action}", True, (0, 0, 0)
-            )
+            action_text = self._text(f"Last Action: {self._last_action}")
             self._background.blit(action_text, (panel_x, panel_y))
         panel_y += line_height
 
         # Last observation
         if self._last_observation:
-            obs_text = self._myfont.render(
-                f"Observation: {self._last_observation}", True, (0, 0, 0)
-            )
+            obs_text = self._text(f"Observation: {self._last_observation}")
             self._background.blit(obs_text, (panel_x, panel_y))
         panel_y += line_height
 
         # Belief size
         if hasattr(self.maze.agent.cur_belief, "__len__"):
-            belief_text = self._myfont.render(
-                f"Belief Size: {len(self.maze.agent.cur_belief)}", True, (0, 0, 0)
-            )
+            belief_text = self._text(f"Belief Size: {len(self.maze.agent.cur_belief)}")
             self._background.blit(belief_text, (panel_x, panel_y))
         panel_y += line_height
 
         # Step count
-        step_text = self._myfont.render(f"Steps: {self._step_count}", True, (0, 0, 0))
+        step_text = self._text(f"Steps: {self._step_count}")
         self._background.blit(step_text, (panel_x, panel_y))
 
     def update(self, action, observation):
@@ -311,6 +410,9 @@ class MazeViz:
         self._last_action = action
         self._last_observation = observation
         self._step_count += 1
+        # Belief representation may have changed (e.g. histogram swapped
+        # for particles); re-resolve the drawer on the next render.
+        self._draw_belief = None
 
     def run_interactive(self):
         """Run interactive visualization (keyboard control)"""
@@ -333,13 +435,11 @@ class MazeViz:
             if not self.running:
                 break
 
-            # Check for quit event
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    break
-
-            if not self.running:
+            # Pump the event queue once, fetching only QUIT events;
+            # planner mode has no other event handling, so this avoids
+            # allocating a list of every queued event per frame.
+            if pygame.event.get(pygame.QUIT):
+                self.running = False
                 break
 
             # Plan
@@ -374,10 +474,8 @@ class MazeViz:
                 print(f"\n🎉 Goal reached in {step + 1} steps!")
                 # Display for a few more frames
                 for _ in range(10):
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            self.running = False
-                    if not self.running:
+                    if pygame.event.get(pygame.QUIT):
+                        self.running = False
                         break
                     self.on_render()
                     self._clock.tick(1)
@@ -0,0 +1,79 @@
+"""
+Scalar numeric kernels for the maze models.
+
+The slip-probability transition, wall-adjacency observation and
+goal/step/wall reward are plain integer arithmetic on int-encoded
+states, so they live here as free functions with no Python-object
+arguments. When numba is installed they are additionally JIT-compiled;
+without it they run as-is, and the decorator is a no-op. The functions
+are deliberately written in nopython-compatible style (scalars and
+arrays only) so both paths share one definition.
+
+Positions are (x, y) ints, orientations/directions are the 0-3 codes
+from :mod:`pomdp_py.problems.maze.domain.direction`, and ``wall_mask``
+is MazeMap's contiguous uint8 grid indexed ``[y, x]``.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def transition_step(x, y, oidx, action_code, main_prob, slip_prob, u):
+    """
+    One slip-probability transition step; ``u`` is a uniform draw in
+    [0, 1). Returns the next (x, y, oidx). Like TransitionModel, this
+    does not block on walls; orientation is unchanged by moves.
+    """
+    code = action_code
+    if u >= main_prob:
+        # Slip to a perpendicular direction: N/S slip E or W, E/W slip
+        # N or S (codes 0=N, 1=E, 2=S, 3=W)
+        if u < main_prob + slip_prob:
+            code = 1 if code % 2 == 0 else 0
+        else:
+            code = 3 if code % 2 == 0 else 2
+    if code == 0:
+        return x, y - 1, oidx
+    elif code == 1:
+        return x + 1, y, oidx
+    elif code == 2:
+        return x, y + 1, oidx
+    return x - 1, y, oidx
+
+
+@njit(cache=True)
+def observe(x, y, wall_mask):
+    """
+    Packed wall bits around (x, y) in observation order (N=8, E=4,
+    S=2, W=1); 0 outside the grid. ``wall_mask`` stores DIR_BIT order
+    (N=1, E=2, S=4, W=8), so the bits are reversed here.
+    """
+    if y < 0 or y >= wall_mask.shape[0] or x < 0 or x >= wall_mask.shape[1]:
+        return 0
+    m = wall_mask[y, x]
+    return ((m & 1) << 3) | ((m & 2) << 1) | ((m & 4) >> 1) | ((m & 8) >> 3)
+
+
+@njit(cache=True)
+def reward(x, y, x2, y2, goal_x, goal_y, goal_reward, step_penalty, wall_penalty):
+    """
+    Reward of moving from (x, y) to (x2, y2): the goal reward at the
+    goal, the wall penalty when the position did not change, the step
+    penalty otherwise (penalties are positive arguments, returned
+    negated).
+    """
+    if x2 == goal_x and y2 == goal_y:
+        return goal_reward
+    if x2 == x and y2 == y:
+        return -wall_penalty
+    return -step_penalty
@@ -1,5 +1,24 @@
 """Components for Maze models"""
 
+from pomdp_py.problems.maze.models.components import example_maze
+from pomdp_py.problems.maze.models.components.grid_belief import GridHistogram
 from pomdp_py.problems.maze.models.components.map import MazeMap, example_mapdict
+from pomdp_py.problems.maze.models.components.particles_soa import ParticleBeliefSoA
+from pomdp_py.problems.maze.models.components.rng import BufferedUniforms
+from pomdp_py.problems.maze.models.components.tables import MazeTables
+from pomdp_py.problems.maze.models.components.rollout import (
+    RolloutSimulator,
+    simulate_rollouts,
+)
 
-__all__ = ["MazeMap", "example_mapdict"]
+__all__ = [
+    "BufferedUniforms",
+    "GridHistogram",
+    "example_maze",
+    "MazeMap",
+    "MazeTables",
+    "example_mapdict",
+    "ParticleBeliefSoA",
+    "RolloutSimulator",
+    "simulate_rollouts",
+]
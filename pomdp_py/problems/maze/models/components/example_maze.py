@@ -0,0 +1,30 @@
+"""
+Import-time constants for the example maze.
+
+The example maze from the paper is fixed, so everything derived from
+its layout — the map object, the packed wall grid, the dimensions and
+the tabular models — can be computed once when this module is imported
+and shared by every episode. Code paths specialized to the example
+maze read these as module globals instead of rebuilding segment lists,
+wall masks and tables per MazeProblem.create() call.
+
+The objects are shared and must be treated as read-only.
+"""
+
+from pomdp_py.problems.maze.models.components.map import MazeMap
+from pomdp_py.problems.maze.models.components.tables import MazeTables
+
+#: The example maze, built once
+EXAMPLE_MAP = MazeMap.create_example_maze()
+
+#: Packed per-cell wall bits of the example maze (uint8, [y, x])
+WALL_MASK = EXAMPLE_MAP._wall_mask
+WALL_MASK.setflags(write=False)
+
+HEIGHT, WIDTH = WALL_MASK.shape
+START = EXAMPLE_MAP.start
+GOAL = EXAMPLE_MAP.goal
+GOAL_CELL = GOAL[1] * WIDTH + GOAL[0]
+
+#: Tabular T/O/R models of the example maze under the default rewards
+EXAMPLE_TABLES = MazeTables(EXAMPLE_MAP)
@@ -0,0 +1,246 @@
+"""
+Dense grid belief for the maze domain.
+
+A maze belief is a distribution over (x, y, orientation) triples, so it
+fits naturally in a float64 array of shape (H, W, 4) aligned with the
+interned state grid, instead of a Histogram dict keyed by State
+objects. Belief queries index the array, sampling is one
+np.random.Generator.choice over the flattened probabilities, and the
+exact Bayes update after (action, observation) runs as a handful of
+whole-array operations: shift the belief mass by the main and slip
+directions, mask by the cells whose deterministic observation matches,
+and renormalize.
+"""
+
+import numpy as np
+import pomdp_py
+
+from pomdp_py.problems.maze.domain.direction import DX, DY, PERP
+from pomdp_py.problems.maze.domain.observation import _LOC_CODE
+from pomdp_py.problems.maze.domain.state import get_state
+
+
+def _shift_slices(shape, code):
+    """(src, dst) slice pairs moving mass one cell in direction `code`;
+    mass moved past the grid edge is dropped (it cannot match any
+    in-grid observation)."""
+    dx, dy = int(DX[code]), int(DY[code])
+    h, w = shape[:2]
+    src = (slice(max(0, -dy), h - max(0, dy)), slice(max(0, -dx), w - max(0, dx)))
+    dst = (slice(max(0, dy), h - max(0, -dy)), slice(max(0, dx), w - max(0, -dx)))
+    return src, dst
+
+
+def _shift(probs, code):
+    """Shift belief mass one cell in direction `code` into a new array."""
+    out = np.zeros_like(probs)
+    src, dst = _shift_slices(probs.shape, code)
+    out[dst] = probs[src]
+    return out
+
+
+class GridHistogram(pomdp_py.GenerativeDistribution):
+    """
+    Belief over maze states stored as a (H, W, 4) probability array
+    indexed [y, x, orientation]. States returned by :meth:`random` and
+    :meth:`mpe` come from the flyweight pool.
+    """
+
+    def __init__(self, probs, maze_map=None, rng=None):
+        """
+        Args:
+            probs (np.ndarray): (H, W, 4) nonnegative array; normalized
+                on construction
+            maze_map (MazeMap): needed for :meth:`update` (observation
+                matching against the wall grid)
+            rng (np.random.Generator): generator used by :meth:`random`
+        """
+        probs = np.asarray(probs, dtype=np.float64)
+        if probs.ndim != 3 or probs.shape[2] != 4:
+            raise ValueError("probs must have shape (H, W, 4)")
+        total = probs.sum()
+        if total <= 0:
+            raise ValueError("probs must have positive total mass")
+        self._probs = probs / total
+        self.maze_map = maze_map
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self._obs_codes = None
+        self._scratch = None
+
+    @property
+    def probs(self):
+        """The (H, W, 4) probability array."""
+        return self._probs
+
+    @classmethod
+    def uniform(cls, maze_map, rng=None):
+        """Uniform belief over every (cell, orientation) of the maze."""
+        h, w = maze_map._wall_mask.shape
+        return cls(np.ones((h, w, 4)), maze_map=maze_map, rng=rng)
+
+    @classmethod
+    def from_histogram(cls, histogram, maze_map, rng=None):
+        """Build from a pomdp_py.Histogram keyed by maze States."""
+        h, w = maze_map._wall_mask.shape
+        probs = np.zeros((h, w, 4))
+        for state in histogram:
+            x, y = state.position
+            probs[y, x, state._oidx] = histogram[state]
+        return cls(probs, maze_map=maze_map, rng=rng)
+
+    def to_histogram(self):
+        """The equivalent pomdp_py.Histogram over pooled States."""
+        return pomdp_py.Histogram(self.get_histogram())
+
+    def get_histogram(self):
+        """Belief as a {State: prob} dict over the nonzero support."""
+        hist = {}
+        for y, x, o in zip(*np.nonzero(self._probs)):
+            hist[get_state((int(x), int(y)), int(o))] = self._probs[y, x, o]
+        return hist
+
+    def to_particles(self, num_particles):
+        """
+        Sample a pomdp_py.Particles belief with one vectorized draw over
+        the flattened probabilities instead of num_particles Python-side
+        random() calls.
+        """
+        idx = self._rng.choice(
+            self._probs.size, size=num_particles, p=self._probs.ravel()
+        )
+        ys, xs, os = np.unravel_index(idx, self._probs.shape)
+        return pomdp_py.Particles(
+            [
+                get_state((int(x), int(y)), int(o))
+                for y, x, o in zip(ys, xs, os)
+            ]
+        )
+
+    def __getitem__(self, state):
+        x, y = state.position
+        h, w = self._probs.shape[:2]
+        if 0 <= y < h and 0 <= x < w:
+            return float(self._probs[y, x, state._oidx])
+        return 0.0
+
+    def __setitem__(self, state, value):
+        x, y = state.position
+        self._probs[y, x, state._oidx] = value
+
+    def __len__(self):
+        return self._probs.size
+
+    def __iter__(self):
+        for y, x, o in zip(*np.nonzero(self._probs)):
+            yield get_state((int(x), int(y)), int(o))
+
+    def random(self):
+        """Sample a pooled State with one flat choice over the array."""
+        i = self._rng.choice(self._probs.size, p=self._probs.ravel())
+        y, x, o = np.unravel_index(i, self._probs.shape)
+        return get_state((int(x), int(y)), int(o))
+
+    def mpe(self):
+        """The most probable state."""
+        y, x, o = np.unravel_index(self._probs.argmax(), self._probs.shape)
+        return get_state((int(x), int(y)), int(o))
+
+    def _observation_codes(self):
+        """
+        Packed observation int per (y, x, o), matching
+        Observation._code; computed once per maze from the wall grid.
+        """
+        if self._obs_codes is None:
+            mask = self.maze_map._wall_mask
+            m = mask.astype(np.int64)
+            # DIR_BIT order (N=1,E=2,S=4,W=8) -> observation wall bits
+            # (N=8,E=4,S=2,W=1)
+            wbits = ((m & 1) << 3) | ((m & 2) << 1) | ((m & 4) >> 1) | ((m & 8) >> 3)
+            codes = wbits[:, :, None] | (np.arange(4, dtype=np.int64) << 4)
+            loc = np.zeros(mask.shape, dtype=np.int64)
+            sx, sy = self.maze_map.start
+            gx, gy = self.maze_map.goal
+            loc[sy, sx] = _LOC_CODE["Start"]
+            loc[gy, gx] = _LOC_CODE["Goal"]
+            self._obs_codes = codes | (loc[:, :, None] << 6)
+        return self._obs_codes
+
+    def update(self, action, observation, slip_prob=0.1):
+        """
+        Exact Bayes update after taking `action` and receiving
+        `observation`; returns a new GridHistogram.
+
+        The prediction step shifts the belief by the main and the two
+        slip directions weighted by their probabilities; the correction
+        step keeps the cells whose deterministic observation equals the
+        received one. Belief mass that would leave the grid is dropped
+        (it cannot produce an in-grid observation).
+        """
+        if self.maze_map is None:
+            raise ValueError("update requires a maze_map")
+        b = self._probs
+        code = action.code
+        main_prob = 1.0 - 2 * slip_prob
+        pred = main_prob * _shift(b, code)
+        pred += slip_prob * _shift(b, int(PERP[code, 0]))
+        pred += slip_prob * _shift(b, int(PERP[code, 1]))
+
+        match = self._observation_codes() == observation._code
+        new_probs = pred * match
+        total = new_probs.sum()
+        if total <= 0:
+            # Observation inconsistent with the predicted belief; fall
+            # back to the observation likelihood alone.
+            new_probs = match.astype(np.float64)
+        new = GridHistogram(new_probs, maze_map=self.maze_map, rng=self._rng)
+        new._obs_codes = self._obs_codes
+        return new
+
+    def update_inplace(self, action, observation, slip_prob=0.1):
+        """
+        Same Bayes update as :meth:`update`, but mutating this belief
+        instead of allocating a new one; returns self.
+
+        The posterior is written into a scratch array the same shape as
+        the belief (allocated once, then reused), and the two arrays are
+        swapped at the end, so a sequence of updates cycles between two
+        buffers with no per-step allocation.
+        """
+        if self.maze_map is None:
+            raise ValueError("update requires a maze_map")
+        b = self._probs
+        scratch = self._scratch
+        if scratch is None:
+            scratch = self._scratch = np.empty_like(b)
+        code = action.code
+        main_prob = 1.0 - 2 * slip_prob
+
+        scratch.fill(0.0)
+        for weight, d in (
+            (main_prob, code),
+            (slip_prob, int(PERP[code, 0])),
+            (slip_prob, int(PERP[code, 1])),
+        ):
+            src, dst = _shift_slices(b.shape, d)
+            scratch[dst] += weight * b[src]
+
+        match = self._observation_codes() == observation._code
+        scratch *= match
+        total = scratch.sum()
+        if total <= 0:
+            # Observation inconsistent with the predicted belief; fall
+            # back to the observation likelihood alone.
+            np.copyto(scratch, match)
+            total = scratch.sum()
+        scratch /= total
+        self._probs, self._scratch = scratch, b
+        return self
+
+    def __str__(self):
+        return "GridHistogram(%s, support=%d)" % (
+            self._probs.shape,
+            int(np.count_nonzero(self._probs)),
+        )
+
+    def __repr__(self):
+        return str(self)
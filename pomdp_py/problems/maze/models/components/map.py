@@ -1,5 +1,10 @@
+import sys
+
 import numpy as np
 
+# Bit assigned to each wall direction in the per-cell wall mask
+DIR_BIT = {"North": 1, "East": 2, "South": 4, "West": 8}
+
 
 class MazeMap:
     """
@@ -20,6 +25,7 @@ class MazeMap:
         self.goal = goal
         self.walls = walls
         self._validate_walls()
+        self._build_wall_mask()
 
     def _validate_walls(self):
         """Validate that walls dictionary has correct structure"""
@@ -27,26 +33,54 @@ class MazeMap:
         if not all(d in valid_dirs for d in self.walls.keys()):
             raise ValueError(f"Wall directions must be in {valid_dirs}")
 
+    def _build_wall_mask(self):
+        """
+        Precompute a per-cell wall bitmask grid from the segment lists.
+
+        Each cell of `self._wall_mask[y, x]` holds the DIR_BIT bits of
+        the walls present at (x, y), so wall queries are a single
+        indexed load + bit test instead of a linear scan over segments.
+        """
+        max_x = max_y = 0
+        for segments in self.walls.values():
+            for (x1, y1), (x2, y2) in segments:
+                max_x = max(max_x, x1, x2)
+                max_y = max(max_y, y1, y2)
+        self._wall_mask = np.zeros((max_y + 1, max_x + 1), dtype=np.uint8)
+
+        # A position counts as "on" a segment if it falls inside the
+        # segment's bounding box (same rule as _is_on_segment), so set
+        # the direction bit over the full box.
+        for direction, segments in self.walls.items():
+            bit = DIR_BIT[direction]
+            for (x1, y1), (x2, y2) in segments:
+                min_x, max_sx = min(x1, x2), max(x1, x2)
+                min_y, max_sy = min(y1, y2), max(y1, y2)
+                self._wall_mask[min_y : max_sy + 1, min_x : max_sx + 1] |= bit
+
+    def wall_bits(self, position):
+        """
+        Returns the packed DIR_BIT wall bits at a position (0 if the
+        position lies outside the maze bounds).
+        """
+        x, y = position
+        mask = self._wall_mask
+        if 0 <= y < mask.shape[0] and 0 <= x < mask.shape[1]:
+            return int(mask[y, x])
+        return 0
+
     def has_wall(self, position, direction):
         """
         Check if there's a wall at a given position in a given direction.
-        
+
         Args:
             position (tuple): (x, y) position to check
             direction (str): "North", "East", "South", or "West"
-            
+
         Returns:
             bool: True if there's a wall in that direction
         """
-        if direction not in self.walls:
-            return False
-
-        x, y = position
-        for wall_segment in self.walls.get(direction, []):
-            # Check if position is on this wall segment
-            if self._is_on_segment(position, wall_segment, direction):
-                return True
-        return False
+        return bool(self.wall_bits(position) & DIR_BIT[direction])
 
     def _is_on_segment(self, position, segment, direction):
         """Check if a position is on a given wall segment"""
@@ -73,11 +107,8 @@ class MazeMap:
         Returns:
             list: List of valid action directions
         """
-        valid_actions = []
-        for direction in ["North", "East", "South", "West"]:
-            if not self.has_wall(position, direction):
-                valid_actions.append(direction)
-        return valid_actions
+        m = self.wall_bits(position)
+        return [d for d, b in DIR_BIT.items() if not (m & b)]
 
     @staticmethod
     def create_example_maze():
@@ -198,10 +229,11 @@ class MazeMap:
         if 0 <= gy < max_y and 0 <= gx < max_x:
             grid[gy][gx] = 'G'
         
-        # Print with row numbers
-        print("  0123456789A")
+        # Emit everything in one write instead of one print per row
+        rows = ["  0123456789A"]
         for y, row in enumerate(grid):
-            print(f"{y} {''.join(row)}")
+            rows.append(f"{y} {''.join(row)}")
+        sys.stdout.write("\n".join(rows) + "\n")
     
     def visualize_walls_debug(self):
         """
@@ -211,21 +243,21 @@ class MazeMap:
         max_x = 11
         max_y = 7
         
-        print("\nWall Debug View (NSEW format: - = wall, . = open)")
-        print("  ", end="")
-        for x in range(max_x):
-            print(f" {x:2}", end="")
-        print()
-        
+        rows = ["\nWall Debug View (NSEW format: - = wall, . = open)"]
+        rows.append("  " + "".join(f" {x:2}" for x in range(max_x)))
+
         for y in range(max_y):
-            print(f"{y} ", end="")
+            cells = [f"{y} "]
             for x in range(max_x):
-                n = '-' if self.has_wall((x, y), "North") else '.'
-                s = '-' if self.has_wall((x, y), "South") else '.'
-                e = '-' if self.has_wall((x, y), "East") else '.'
-                w = '-' if self.has_wall((x, y), "West") else '.'
-                print(f"{n}{s}{e}{w}", end="")
-            print()
+                # One packed read per cell instead of four has_wall calls
+                m = self.wall_bits((x, y))
+                n = '-' if m & DIR_BIT["North"] else '.'
+                s = '-' if m & DIR_BIT["South"] else '.'
+                e = '-' if m & DIR_BIT["East"] else '.'
+                w = '-' if m & DIR_BIT["West"] else '.'
+                cells.append(f"{n}{s}{e}{w}")
+            rows.append("".join(cells))
+        sys.stdout.write("\n".join(rows) + "\n")
     
     def visualize(self):
         """
@@ -245,12 +277,11 @@ class MazeMap:
             wall_row = []
             
             for x in range(max_x):
-                # Check walls
-                has_north = self.has_wall((x, y), "North")
-                has_south = self.has_wall((x, y), "South")
-                has_west = self.has_wall((x, y), "West")
-                has_east = self.has_wall((x, y), "East")
-                
+                # One packed read per cell instead of four has_wall calls
+                m = self.wall_bits((x, y))
+                has_south = bool(m & DIR_BIT["South"])
+                has_west = bool(m & DIR_BIT["West"])
+
                 # Cell content
                 if (x, y) == self.start:
                     cell_char = 'S'
@@ -283,9 +314,8 @@ class MazeMap:
             if y < max_y - 1 or y == max_y - 1:  # Show bottom wall for last row
                 display.append(''.join(wall_row) + ' ')
         
-        # Print
-        for line in display:
-            print(line)
+        # Emit everything in one write
+        sys.stdout.write("\n".join(display) + "\n")
 
 
 # Example maze dict (for reference)
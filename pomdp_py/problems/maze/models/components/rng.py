@@ -0,0 +1,49 @@
+"""
+Buffered uniform random draws for the maze models.
+
+The transition model consumes one uniform per sample — roughly 500k per
+POUCT episode — and drawing them one at a time crosses into the RNG for
+every call. BufferedUniforms wraps a seeded np.random.Generator and
+refills a block of draws at once, handing them out as plain Python
+floats; it also gives episodes a single reseedable source so runs are
+reproducible end to end.
+"""
+
+import numpy as np
+
+
+class BufferedUniforms:
+    """
+    Callable source of uniform [0, 1) floats drawn from a NumPy
+    Generator in blocks.
+
+    Calling the instance returns the next draw; the underlying block
+    (default 4096 values, converted to a list of Python floats so the
+    per-call pop is just an index) is regenerated when exhausted.
+    """
+
+    def __init__(self, seed=None, block=4096):
+        self._block = block
+        self._rng = np.random.default_rng(seed)
+        self._buf = self._rng.random(block).tolist()
+        self._idx = 0
+
+    def __call__(self):
+        i = self._idx
+        buf = self._buf
+        if i == len(buf):
+            buf = self._buf = self._rng.random(self._block).tolist()
+            i = 0
+        self._idx = i + 1
+        return buf[i]
+
+    def reseed(self, seed):
+        """Restart the stream from a seed (discards buffered draws)."""
+        self._rng = np.random.default_rng(seed)
+        self._buf = self._rng.random(self._block).tolist()
+        self._idx = 0
+
+    @property
+    def generator(self):
+        """The underlying np.random.Generator, for batch consumers."""
+        return self._rng
@@ -0,0 +1,171 @@
+"""
+Precomputed transition/observation/reward tables for a fixed maze.
+
+The maze is static, so everything the models compute per call can be
+materialized once as NumPy arrays indexed by flat state index
+``s = (y * W + x) * 4 + orientation`` and direction code. Sampling a
+transition is then one uniform draw plus a searchsorted against a
+3-entry cumulative row, observing is a single int lookup, and rewards
+are direct 2D reads — tiny tables that stay in cache.
+
+Like the batch rollout kernel (and unlike TransitionModel), the tables
+treat walls as blocking and clip at the grid edge, so the state space
+stays closed over the grid; a blocked move keeps the state in place
+and earns the wall penalty.
+"""
+
+import numpy as np
+
+from pomdp_py.problems.maze.domain.direction import DX, DY, PERP, WALL_BITS
+from pomdp_py.problems.maze.domain.observation import _LOC_CODE
+from pomdp_py.problems.maze.domain.state import get_state
+
+
+class MazeTables:
+    """
+    Tabular form of the maze models over flat state indices.
+
+    Attributes:
+        n_states (int): H * W * 4
+        T_next (np.ndarray): (4, S, 3) int32; next state index for the
+            (main, slip1, slip2) outcome of each (action, state)
+        T_cdf (np.ndarray): (4, S, 3) float32 cumulative outcome
+            probabilities, ending at 1.0
+        O_code (np.ndarray): (S,) int64 packed observation code per
+            state (same packing as Observation._code)
+        R (np.ndarray): (4, S, 3) float32 reward of each outcome
+        R_exp (np.ndarray): (4, S) float32 expected immediate reward
+    """
+
+    def __init__(
+        self,
+        maze_map,
+        slip_prob=0.1,
+        goal_reward=10,
+        step_penalty=1,
+        wall_penalty=5,
+    ):
+        self.maze_map = maze_map
+        self.slip_prob = slip_prob
+        self.main_prob = 1.0 - 2 * slip_prob
+        h, w = maze_map._wall_mask.shape
+        self.height, self.width = h, w
+        self.n_states = h * w * 4
+
+        mask = maze_map._wall_mask
+        ys, xs = np.mgrid[0:h, 0:w]
+        ys, xs = ys.ravel(), xs.ravel()  # one entry per cell
+
+        # Per (direction, cell): blocked moves stay, others step and
+        # clip at the edge
+        next_cell = np.empty((4, h * w), dtype=np.int32)
+        for d in range(4):
+            blocked = (mask[ys, xs] & WALL_BITS[d]) != 0
+            nx = np.clip(np.where(blocked, xs, xs + DX[d]), 0, w - 1)
+            ny = np.clip(np.where(blocked, ys, ys + DY[d]), 0, h - 1)
+            next_cell[d] = ny * w + nx
+
+        gx, gy = maze_map.goal
+        goal_cell = gy * w + gx
+        cells = ys * w + xs
+
+        # Expand cells to the 4 orientations: s = cell * 4 + o, and
+        # orientation never changes, so next state index shares o.
+        self.T_next = np.empty((4, self.n_states, 3), dtype=np.int32)
+        self.R = np.empty((4, self.n_states, 3), dtype=np.float32)
+        probs = np.array([self.main_prob, slip_prob, slip_prob], dtype=np.float32)
+        self.T_cdf = np.broadcast_to(
+            np.cumsum(probs), (4, self.n_states, 3)
+        ).astype(np.float32)
+        for a in range(4):
+            dirs = (a, int(PERP[a, 0]), int(PERP[a, 1]))
+            for k, d in enumerate(dirs):
+                nc = next_cell[d]
+                reward = np.where(
+                    nc == goal_cell,
+                    float(goal_reward),
+                    np.where(nc == cells, -float(wall_penalty), -float(step_penalty)),
+                ).astype(np.float32)
+                for o in range(4):
+                    self.T_next[a, cells * 4 + o, k] = nc * 4 + o
+                    self.R[a, cells * 4 + o, k] = reward
+        self.R_exp = (self.R * probs).sum(axis=2)
+
+        # Packed observation codes (wall bits N=8,E=4,S=2,W=1 from the
+        # DIR_BIT-ordered mask, orientation, location)
+        m = mask.astype(np.int64).ravel()
+        wbits = ((m & 1) << 3) | ((m & 2) << 1) | ((m & 4) >> 1) | ((m & 8) >> 3)
+        loc = np.zeros(h * w, dtype=np.int64)
+        sx, sy = maze_map.start
+        loc[sy * w + sx] = _LOC_CODE["Start"]
+        loc[goal_cell] = _LOC_CODE["Goal"]
+        self.O_code = np.empty(self.n_states, dtype=np.int64)
+        for o in range(4):
+            self.O_code[cells * 4 + o] = wbits | (o << 4) | (loc << 6)
+
+        self.goal_cell = goal_cell
+
+    def state_index(self, state):
+        """Flat index of a State (position must be inside the grid)."""
+        x, y = state.position
+        return (y * self.width + x) * 4 + state._oidx
+
+    def index_state(self, idx):
+        """The pooled State for a flat index."""
+        cell, o = divmod(int(idx), 4)
+        y, x = divmod(cell, self.width)
+        return get_state((x, y), o)
+
+    def sample_next(self, s_idx, a_code, u):
+        """Next state index for one uniform draw `u` in [0, 1)."""
+        k = np.searchsorted(self.T_cdf[a_code, s_idx], u)
+        return int(self.T_next[a_code, s_idx, k])
+
+    def sample_next_batch(self, s_idx, a_code, rng):
+        """
+        Vectorized transitions: next indices and rewards for an int
+        array of state indices under one action.
+        """
+        u = rng.random(len(s_idx))
+        k = (u >= self.main_prob).astype(np.int64) + (
+            u >= self.main_prob + self.slip_prob
+        )
+        return self.T_next[a_code, s_idx, k], self.R[a_code, s_idx, k]
+
+    def batch_rollout(self, init_indices, depth, discount_factor=1.0, rng=None):
+        """
+        Run one uniform-random rollout per initial state index, stepping
+        all of them in lockstep through the tables.
+
+        Per step and rollout this is one uniform for the action, one for
+        the slip outcome and three fancy-indexed reads; rollouts stop
+        accruing reward once they reach the goal.
+
+        Args:
+            init_indices (np.ndarray): (N,) int array of start indices
+            depth (int): steps per rollout
+            discount_factor (float): per-step discount
+            rng (np.random.Generator): generator for the draws
+
+        Returns:
+            np.ndarray: (N,) total discounted reward per rollout
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        cur = np.asarray(init_indices, dtype=np.int64)
+        n = len(cur)
+        total = np.zeros(n, dtype=np.float64)
+        done = (cur >> 2) == self.goal_cell
+        disc = 1.0
+        for _ in range(depth):
+            a = rng.integers(0, 4, size=n)
+            u = rng.random(n)
+            k = (u >= self.main_prob).astype(np.int64) + (
+                u >= self.main_prob + self.slip_prob
+            )
+            nxt = self.T_next[a, cur, k]
+            total += np.where(done, 0.0, disc * self.R[a, cur, k])
+            done |= (nxt >> 2) == self.goal_cell
+            cur = nxt
+            disc *= discount_factor
+        return total
@@ -25,6 +25,15 @@ class ObservationModel(pomdp_py.ObservationModel):
             maze_map: MazeMap object containing the maze layout
         """
         self.maze_map = maze_map
+        # Cached locally so the rollout hot path avoids the attribute
+        # chain through maze_map on every sample
+        self._goal = maze_map.goal
+        self._start = maze_map.start
+        # Observations are deterministic in (position, orientation), and
+        # the maze has only ~W*H*4 distinct keys, so memoize them; after
+        # the first visit to a cell the whole wall/location lookup
+        # collapses to one dict hit.
+        self._obs_cache = {}
 
     def probability(self, observation, next_state, action):
         """
@@ -68,24 +77,26 @@ class ObservationModel(pomdp_py.ObservationModel):
             Observation: The observation in this state
         """
         position = state.position
-        orientation = state.orientation
+        key = (position, state._oidx)
+        obs = self._obs_cache.get(key)
+        if obs is not None:
+            return obs
 
-        # Check for walls in all 4 directions
-        walls = (
-            self.maze_map.has_wall(position, "North"),
-            self.maze_map.has_wall(position, "East"),
-            self.maze_map.has_wall(position, "South"),
-            self.maze_map.has_wall(position, "West"),
-        )
+        # Fetch the packed wall byte once and unpack all four sides
+        # (DIR_BIT order: N=1, E=2, S=4, W=8)
+        m = self.maze_map.wall_bits(position)
+        walls = (bool(m & 1), bool(m & 2), bool(m & 4), bool(m & 8))
 
         # Detect special locations
         location = None
-        if position == self.maze_map.goal:
+        if position == self._goal:
             location = "Goal"
-        elif position == self.maze_map.start:
+        elif position == self._start:
             location = "Start"
 
-        return Observation(walls, orientation, location)
+        obs = Observation(walls, state.orientation, location)
+        self._obs_cache[key] = obs
+        return obs
 
     def get_all_observations(self):
         """
@@ -15,22 +15,32 @@ class PolicyModel(pomdp_py.RolloutPolicy):
     Used as a rollout policy in simulation-based planners.
     """
 
-    def __init__(self):
-        """Initialize the policy model"""
+    def __init__(self, tables=None, rng=None):
+        """
+        Args:
+            tables (MazeTables): optional precomputed maze tables; when
+                given, :meth:`batch_rollout` is available
+            rng (np.random.Generator): generator used by batch rollouts
+        """
         self._all_actions = get_all_actions()
+        self._n = len(self._all_actions)
+        self._tables = tables
+        self._rng = rng
 
     def sample(self, state, history=None):
         """
         Sample an action uniformly at random.
-        
+
         Args:
             state: Current state
             history: Action-observation history (optional)
-            
+
         Returns:
             Action: Randomly sampled action
         """
-        return random.choice(self._all_actions)
+        # Indexed draw instead of random.choice: skips choice()'s len()
+        # and bounds handling on a path that fires once per rollout step
+        return self._all_actions[random.randrange(self._n)]
 
     def rollout(self, state, history=None):
         """
@@ -57,3 +67,24 @@ class PolicyModel(pomdp_py.RolloutPolicy):
             list: All possible actions
         """
         return self._all_actions
+
+    def batch_rollout(self, init_state_indices, depth, discount_factor=1.0):
+        """
+        Run uniform-random rollouts for a whole array of flat state
+        indices in lockstep through the precomputed maze tables,
+        instead of one sample()/rollout() call per step per rollout.
+
+        Args:
+            init_state_indices (np.ndarray): (N,) int array of flat
+                state indices (see MazeTables.state_index)
+            depth (int): steps per rollout
+            discount_factor (float): per-step discount
+
+        Returns:
+            np.ndarray: (N,) total discounted reward per rollout
+        """
+        if self._tables is None:
+            raise ValueError("batch_rollout requires PolicyModel(tables=...)")
+        return self._tables.batch_rollout(
+            init_state_indices, depth, discount_factor=discount_factor, rng=self._rng
+        )
@@ -28,6 +28,14 @@ class RewardModel(pomdp_py.RewardModel):
         self.goal_reward = goal_reward
         self.step_penalty = step_penalty
         self.wall_penalty = wall_penalty
+        # Rewards depend only on position equality against the goal and
+        # the previous position; bind the goal and signed reward values
+        # once so _reward_func does local attribute reads only, instead
+        # of chasing maze_map and negating penalties per rollout step.
+        self._goal = maze_map.goal
+        self._gr = goal_reward
+        self._sp = -step_penalty
+        self._wp = -wall_penalty
 
     def sample(self, state, action, next_state):
         """
@@ -56,13 +64,8 @@ class RewardModel(pomdp_py.RewardModel):
         Returns:
             float: Reward value
         """
-        # Check if goal was reached
-        if next_state.position == self.maze_map.goal:
-            return self.goal_reward
-
-        # Check if agent hit a wall (position didn't change)
-        if next_state.position == state.position:
-            return -self.wall_penalty
-
-        # Default: step penalty
-        return -self.step_penalty
+        # Goal reached, wall hit (position unchanged), or plain step
+        p = next_state.position
+        return self._gr if p == self._goal else (
+            self._wp if p == state.position else self._sp
+        )
@@ -9,8 +9,22 @@ orthogonal directions (perpendicular to the intended direction).
 
 import pomdp_py
 import random
-from pomdp_py.problems.maze.domain.state import State
+import numpy as np
+from pomdp_py.problems.maze.domain.state import State, get_state
 from pomdp_py.problems.maze.domain.action import MazeAction
+from pomdp_py.problems.maze.domain.direction import DX, DY, PERP
+from pomdp_py.problems.maze.models._kernels import transition_step
+
+# String-keyed counterparts of the direction code arrays, kept for the
+# name-based helper methods; built once at import instead of as dict
+# literals inside each call.
+MOVE_DELTA = {"North": (0, -1), "South": (0, 1), "East": (1, 0), "West": (-1, 0)}
+PERP_NAMES = {
+    "North": ("East", "West"),
+    "South": ("East", "West"),
+    "East": ("North", "South"),
+    "West": ("North", "South"),
+}
 
 
 class TransitionModel(pomdp_py.TransitionModel):
@@ -18,16 +32,29 @@ class TransitionModel(pomdp_py.TransitionModel):
     Stochastic transition model with slip probability.
     """
 
-    def __init__(self, slip_prob=0.1, maze_map=None):
+    def __init__(self, slip_prob=0.1, maze_map=None, rng=None):
         """
         Args:
             slip_prob (float): Probability of slipping to each orthogonal direction
                              Main probability of moving in intended direction: 1 - 2*slip_prob
             maze_map: MazeMap object for checking wall collisions
+            rng: optional callable returning uniform [0, 1) draws (e.g. a
+                BufferedUniforms); defaults to random.random
         """
         self.slip_prob = slip_prob
         self.main_prob = 1.0 - 2 * slip_prob
         self.maze_map = maze_map
+        self._draw = rng if rng is not None else random.random
+        # For a fixed maze the outcomes of (position, orientation, action)
+        # are static, so they are computed once per key and reused; the
+        # cache fills lazily since rollouts can wander beyond the nominal
+        # grid bounds.
+        self._outcome_cache = {}
+        # Per-key {next_state: prob} tables for probability(); filled
+        # lazily alongside the outcome cache. Probabilities of outcomes
+        # that land on the same next state are summed, so queries return
+        # the total mass on that state rather than one branch's share.
+        self._prob_cache = {}
 
     def probability(self, next_state, state, action):
         """
@@ -41,13 +68,14 @@ class TransitionModel(pomdp_py.TransitionModel):
         Returns:
             float: Probability of transition
         """
-        # Get the possible outcomes (main and two slip directions)
-        outcomes = self._get_transition_outcomes(state, action)
-
-        for prob, outcome_state in outcomes:
-            if next_state == outcome_state:
-                return prob
-        return 0.0
+        key = (state.position, state._oidx, action.name)
+        table = self._prob_cache.get(key)
+        if table is None:
+            table = {}
+            for prob, outcome_state in self._get_transition_outcomes(state, action):
+                table[outcome_state] = table.get(outcome_state, 0.0) + prob
+            self._prob_cache[key] = table
+        return table.get(next_state, 0.0)
 
     def sample(self, state, action):
         """
@@ -60,54 +88,87 @@ class TransitionModel(pomdp_py.TransitionModel):
         Returns:
             State: Next state sampled from the distribution
         """
-        outcomes = self._get_transition_outcomes(state, action)
+        # Branch directly on a single uniform and materialize only the
+        # chosen outcome; the arithmetic lives in the _kernels module
+        # (JIT-compiled when numba is available).
+        x, y = state.position
+        nx, ny, oidx = transition_step(
+            x, y, state._oidx, action.code, self.main_prob, self.slip_prob,
+            self._draw(),
+        )
+        return get_state((nx, ny), oidx)
+
+    def sample_batch(self, positions, orientations, action, rng=None):
+        """
+        Sample next states for a whole array of particles at once.
 
-        # Sample based on probabilities
-        rand = random.uniform(0, 1)
-        cumulative_prob = 0.0
-        for prob, next_state in outcomes:
-            cumulative_prob += prob
-            if rand <= cumulative_prob:
-                return next_state
+        Args:
+            positions (np.ndarray): (N, 2) array of (x, y) positions
+            orientations (np.ndarray): (N,) array of orientation indices
+            action: Action taken (applied to every particle)
+            rng (np.random.Generator): optional generator to draw from
 
-        # Fallback (should not reach here)
-        return outcomes[-1][1]
+        Returns:
+            tuple: (next_positions, orientations) arrays; orientations
+            are unchanged by maze transitions
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        code = action.code
+        dirs = (code, PERP[code, 0], PERP[code, 1])
+
+        # Deltas for (main, slip1, slip2), then one vectorized pick per
+        # particle based on a single array of uniforms.
+        deltas = np.stack([DX[list(dirs)], DY[list(dirs)]], axis=1).astype(
+            positions.dtype
+        )
+        u = rng.random(len(positions))
+        choice = np.where(
+            u < self.main_prob, 0, np.where(u < self.main_prob + self.slip_prob, 1, 2)
+        )
+        return positions + deltas[choice], orientations
 
     def _get_transition_outcomes(self, state, action):
         """
         Get all possible transition outcomes and their probabilities.
-        
+        Outcomes are cached per (position, orientation, action), so for
+        a fixed maze each key is computed once across all rollouts.
+
         Returns:
             list: List of (probability, next_state) tuples
         """
-        outcomes = []
-        action_dir = action.name
-
-        # Get orthogonal directions for slipping
-        perpendicular_dirs = self._get_perpendicular_directions(action_dir)
-
-        # Main direction outcome
-        next_pos_main = self._move_in_direction(state.position, action_dir)
-        next_state_main = State(next_pos_main, state.orientation)
-        outcomes.append((self.main_prob, next_state_main))
-
-        # Slip outcomes (two orthogonal directions)
-        for slip_dir in perpendicular_dirs:
-            next_pos_slip = self._move_in_direction(state.position, slip_dir)
-            next_state_slip = State(next_pos_slip, state.orientation)
-            outcomes.append((self.slip_prob, next_state_slip))
-
+        key = (state.position, state._oidx, action.name)
+        outcomes = self._outcome_cache.get(key)
+        if outcomes is not None:
+            return outcomes
+
+        x, y = state.position
+        code = action.code
+
+        # Main direction outcome, then the two perpendicular slips; all
+        # three are plain int array indexing on the direction code.
+        outcomes = [
+            (
+                self.main_prob,
+                get_state((x + int(DX[code]), y + int(DY[code])), state._oidx),
+            )
+        ]
+        for slip_code in PERP[code]:
+            outcomes.append(
+                (
+                    self.slip_prob,
+                    get_state(
+                        (x + int(DX[slip_code]), y + int(DY[slip_code])), state._oidx
+                    ),
+                )
+            )
+
+        self._outcome_cache[key] = outcomes
         return outcomes
 
     def _get_perpendicular_directions(self, direction):
         """Get the two perpendicular directions to the given direction"""
-        perpendicular = {
-            "North": ["East", "West"],
-            "South": ["East", "West"],
-            "East": ["North", "South"],
-            "West": ["North", "South"],
-        }
-        return perpendicular[direction]
+        return PERP_NAMES[direction]
 
     def _move_in_direction(self, position, direction):
         """
@@ -120,14 +181,8 @@ class TransitionModel(pomdp_py.TransitionModel):
         Returns:
             tuple: New position
         """
-        x, y = position
-        move_map = {
-            "North": (x, y - 1),
-            "South": (x, y + 1),
-            "East": (x + 1, y),
-            "West": (x - 1, y),
-        }
-        return move_map[direction]
+        dx, dy = MOVE_DELTA[direction]
+        return (position[0] + dx, position[1] + dy)
 
     def get_all_states(self):
         """Get all possible states in the maze (used for value iteration)"""
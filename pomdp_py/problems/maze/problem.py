@@ -14,7 +14,7 @@ on its actual position in the maze.
 """
 
 import pomdp_py
-from pomdp_py.problems.maze.domain.state import State
+from pomdp_py.problems.maze.domain.state import State, get_state
 from pomdp_py.problems.maze.domain.action import get_all_actions, MazeAction
 from pomdp_py.problems.maze.domain.observation import Observation
 from pomdp_py.problems.maze.env.env import MazeEnvironment
@@ -22,8 +22,12 @@ from pomdp_py.problems.maze.models.transition_model import TransitionModel
 from pomdp_py.problems.maze.models.observation_model import ObservationModel
 from pomdp_py.problems.maze.models.reward_model import RewardModel
 from pomdp_py.problems.maze.models.policy_model import PolicyModel
+from pomdp_py.problems.maze.models.components.grid_belief import GridHistogram
 from pomdp_py.problems.maze.models.components.map import MazeMap
+from pomdp_py.problems.maze.models.components.rng import BufferedUniforms
+import numpy as np
 import random
+import sys
 
 
 class MazeProblem(pomdp_py.POMDP):
@@ -41,6 +45,7 @@ class MazeProblem(pomdp_py.POMDP):
         goal_reward=10,
         step_penalty=1,
         wall_penalty=5,
+        seed=None,
     ):
         """
         Args:
@@ -51,9 +56,17 @@ class MazeProblem(pomdp_py.POMDP):
             goal_reward (float): Reward for reaching the goal
             step_penalty (float): Cost for each step
             wall_penalty (float): Penalty for hitting a wall
+            seed: Seed for the problem's uniform-draw stream; episodes
+                with the same seed replay the same transitions
         """
+        # One buffered uniform stream shared by the models; draws are
+        # generated in blocks instead of one RNG call per sample
+        self._rng = BufferedUniforms(seed)
+
         # Create models
-        transition_model = TransitionModel(slip_prob=slip_prob, maze_map=maze_map)
+        transition_model = TransitionModel(
+            slip_prob=slip_prob, maze_map=maze_map, rng=self._rng
+        )
         observation_model = ObservationModel(maze_map)
         reward_model = RewardModel(
             maze_map,
@@ -80,6 +93,14 @@ class MazeProblem(pomdp_py.POMDP):
 
         self.maze_map = maze_map
 
+        # Prefill the state flyweight pool over the grid so planner
+        # rollouts never pay a pool miss for in-bounds states.
+        height, width = maze_map._wall_mask.shape
+        for y in range(height):
+            for x in range(width):
+                for oidx in range(4):
+                    get_state((x, y), oidx)
+
     @staticmethod
     def create(
         maze_map=None,
@@ -89,10 +110,11 @@ class MazeProblem(pomdp_py.POMDP):
         goal_reward=10,
         step_penalty=1,
         wall_penalty=5,
+        seed=None,
     ):
         """
         Factory method to create a MazeProblem with default or custom parameters.
-        
+
         Args:
             maze_map (MazeMap): Maze layout (default: example maze)
             init_state (State): Initial true state (default: maze start position)
@@ -101,7 +123,8 @@ class MazeProblem(pomdp_py.POMDP):
             goal_reward (float): Goal reward
             step_penalty (float): Step penalty
             wall_penalty (float): Wall penalty
-            
+            seed: Seed for the problem's uniform-draw stream
+
         Returns:
             MazeProblem: Configured maze problem instance
         """
@@ -113,12 +136,15 @@ class MazeProblem(pomdp_py.POMDP):
         if init_state is None:
             init_state = State(maze_map.start, "North")
 
-        # Create uniform belief over some reasonable set of states
+        # Uniform belief over the start-cell orientations, built as an
+        # array write on the dense grid belief rather than a Histogram
+        # dict comprehension
         if init_belief is None:
-            # Simple uniform belief over a few possible starting positions
-            init_belief = pomdp_py.Histogram(
-                {State(maze_map.start, orientation): 0.25 for orientation in ["North", "East", "South", "West"]}
-            )
+            height, width = maze_map._wall_mask.shape
+            probs = np.zeros((height, width, 4))
+            sx, sy = maze_map.start
+            probs[sy, sx, :] = 0.25
+            init_belief = GridHistogram(probs, maze_map=maze_map)
 
         return MazeProblem(
             maze_map,
@@ -128,75 +154,190 @@ class MazeProblem(pomdp_py.POMDP):
             goal_reward=goal_reward,
             step_penalty=step_penalty,
             wall_penalty=wall_penalty,
+            seed=seed,
+        )
+
+    @staticmethod
+    def create_specialized(**kwargs):
+        """
+        Create a MazeProblem specialized to the example maze: the map
+        (and its precomputed wall mask) comes from the module-level
+        constants in components.example_maze, so repeated episode
+        construction skips rebuilding the layout. Accepts the same
+        keyword arguments as :meth:`create` except `maze_map`.
+
+        The shared map must be treated as read-only.
+        """
+        from pomdp_py.problems.maze.models.components.example_maze import EXAMPLE_MAP
+
+        return MazeProblem.create(maze_map=EXAMPLE_MAP, **kwargs)
+
+
+def _goal_belief_mass(belief, goal):
+    """Probability mass the belief places on the goal cell (any
+    orientation); 0.0 for belief types without a readable histogram."""
+    if isinstance(belief, GridHistogram):
+        gx, gy = goal
+        return float(belief.probs[gy, gx, :].sum())
+    if hasattr(belief, "get_histogram"):
+        return sum(
+            prob
+            for state, prob in belief.get_histogram().items()
+            if state.position == goal
         )
+    return 0.0
 
 
-def solve(maze_problem, planner, max_steps=50):
+def solve(
+    maze_problem,
+    planner,
+    max_steps=50,
+    verbose=1,
+    interactive=False,
+    seed=None,
+    goal_belief_threshold=0.95,
+):
     """
-    Run the maze solving loop with detailed terminal output.
-    
+    Run the maze solving loop.
+
     Args:
         maze_problem (MazeProblem): Problem instance
         planner (Planner): Planning algorithm (POUCT or POMCP)
         max_steps (int): Maximum number of steps to run
+        verbose (int): 0 for silent (benchmark) runs, >= 1 for per-step
+            terminal output
+        interactive (bool): If True, wait for Enter when the goal is
+            reached
+        seed: If given, reseeds the problem's uniform-draw stream and
+            the stdlib random module (used by the rollout policy) so
+            the episode is reproducible
+        goal_belief_threshold (float): Stop before planning once the
+            belief puts at least this much mass on the goal cell;
+            planning sims after the belief has collapsed there are
+            wasted
+
+    Returns:
+        list: Per-step (step, reward, total_reward, num_sims,
+        planning_time) tuples; num_sims/planning_time are None for
+        planners that do not report them
     """
     total_reward = 0
-    
-    for step in range(max_steps):
-        # Plan
-        real_action = planner.plan(maze_problem.agent)
-
-        # Sample next state
-        current_state = maze_problem.env.state
-        next_state = maze_problem.env.transition_model.sample(current_state, action=real_action)
-        
-        # Get reward
-        reward = maze_problem.env.reward_model.sample(
-            current_state, real_action, next_state
+    stats = []
+
+    if seed is not None:
+        random.seed(seed)
+        maze_problem._rng.reseed(seed)
+
+    # The planner type and the models never change within a call;
+    # resolve the planner-specific reporting and bind the objects the
+    # loop touches once, instead of isinstance checks and attribute
+    # chains per iteration.
+    agent = maze_problem.agent
+    env = maze_problem.env
+    observation_model = agent.observation_model
+    goal = maze_problem.maze_map.goal
+    reports_sims = isinstance(planner, (pomdp_py.POUCT, pomdp_py.POMCP))
+    if isinstance(planner, pomdp_py.POMCP):
+        # The particle count is fixed by the filter; len() per step only
+        # re-walks the attribute chain for printing
+        particle_count = len(agent.cur_belief)
+        planner_line = lambda n, t: (
+            f"Num Sims: {n}\nBelief Particles: {particle_count}\n"
         )
+    elif isinstance(planner, pomdp_py.POUCT):
+        planner_line = lambda n, t: f"Num Sims: {n}\nPlanning Time: {t:.4f}s\n"
+    else:
+        planner_line = lambda n, t: ""
+
+    for step in range(max_steps):
+        # Belief already collapsed onto the goal: skip the planning cost
+        if _goal_belief_mass(agent.cur_belief, goal) >= goal_belief_threshold:
+            if verbose >= 1:
+                sys.stdout.write(
+                    "Belief mass on goal >= %.2f; stopping.\n" % goal_belief_threshold
+                )
+            break
+
+        # Plan, then execute the same sampled transition
+        real_action = planner.plan(agent)
+        reward, next_state = env.peek_transition(real_action)
+        env.commit_state(next_state)
         total_reward += reward
 
         # Get observation from the new state
-        real_observation = maze_problem.agent.observation_model.sample(
-            next_state, real_action
-        )
+        real_observation = observation_model.sample(next_state, real_action)
+
+        # Update history and belief
+        agent.update_history(real_action, real_observation)
+        planner.update(agent, real_action, real_observation)
+
+        num_sims = planning_time = None
+        if reports_sims:
+            num_sims = planner.last_num_sims
+            planning_time = planner.last_planning_time
+        stats.append((step + 1, reward, total_reward, num_sims, planning_time))
+
+        goal_reached = next_state.position == goal
 
-        # Update history
-        maze_problem.agent.update_history(real_action, real_observation)
-
-        # Update belief
-        planner.update(maze_problem.agent, real_action, real_observation)
-
-        # Print step information
-        print("==== Step %d ====" % (step + 1))
-        print("True Position: %s" % str(next_state.position))
-        print("True Orientation: %s" % str(next_state.orientation))
-        print("Action: %s" % str(real_action))
-        print("Observation: %s" % str(real_observation))
-        print("Reward: %s" % str(reward))
-        print("Cumulative Reward: %s" % str(total_reward))
-        
-        if isinstance(planner, pomdp_py.POUCT):
-            print("Num Sims: %d" % planner.last_num_sims)
-            print("Planning Time: %.4fs" % planner.last_planning_time)
-        elif isinstance(planner, pomdp_py.POMCP):
-            print("Num Sims: %d" % planner.last_num_sims)
-            print("Belief Particles: %d" % len(maze_problem.agent.cur_belief))
-
-        # Check if goal reached
-        if next_state.position == maze_problem.maze_map.goal:
-            print("\n✓ Goal reached!")
-            input("Press Enter to continue...")
+        if verbose >= 1:
+            # One write per step instead of 7-9 print calls
+            msg = (
+                f"==== Step {step + 1} ====\n"
+                f"True Position: {next_state.position}\n"
+                f"True Orientation: {next_state.orientation}\n"
+                f"Action: {real_action}\n"
+                f"Observation: {real_observation}\n"
+                f"Reward: {reward}\n"
+                f"Cumulative Reward: {total_reward}\n"
+            ) + planner_line(num_sims, planning_time)
+            if goal_reached:
+                msg += "\n✓ Goal reached!\n"
+            sys.stdout.write(msg)
+
+        if goal_reached:
+            if interactive:
+                input("Press Enter to continue...")
             break
-    
-    print(f"\nEpisode complete. Total reward: {total_reward}")
+
+    if verbose >= 1:
+        sys.stdout.write(f"\nEpisode complete. Total reward: {total_reward}\n")
+    return stats
 
 
 def main():
     """Main solving function"""
+    import argparse
+
+    from pomdp_py.problems.maze.solvers import QMDPPlanner, run_qmdp_episode
+
+    parser = argparse.ArgumentParser(description="Solve the example maze")
+    parser.add_argument(
+        "--planner",
+        choices=("all", "qmdp", "pouct"),
+        default="all",
+        help="'qmdp' runs the whole episode through the compiled "
+        "table-based driver; 'all' demos QMDP and POUCT step by step",
+    )
+    args = parser.parse_args()
+
+    if args.planner == "qmdp":
+        # Entire episode in one call over the table arrays; no per-step
+        # Python loop at all
+        total_reward, steps = run_qmdp_episode(discount_factor=0.95, max_steps=50)
+        print("QMDP episode: %d steps, discounted return %.4f" % (steps, total_reward))
+        return
+
     print("Creating Maze Problem...")
     maze = MazeProblem.create()
 
+    if args.planner == "all":
+        print("\n** Testing QMDP **")
+        qmdp = QMDPPlanner(maze.maze_map, discount_factor=0.95)
+        solve(maze, qmdp, max_steps=50)
+
+        # Reset for next test
+        maze = MazeProblem.create()
+
     print("\n** Testing POUCT **")
     pouct = pomdp_py.POUCT(
         max_depth=10,
@@ -0,0 +1,10 @@
+"""Offline solvers for the Maze POMDP"""
+
+from pomdp_py.problems.maze.solvers.qmdp import QMDPPlanner, solve_qmdp
+from pomdp_py.problems.maze.solvers.qmdp_episode import run_qmdp_episode
+
+__all__ = [
+    "QMDPPlanner",
+    "run_qmdp_episode",
+    "solve_qmdp",
+]
@@ -0,0 +1,102 @@
+"""
+QMDP solver for the maze domain.
+
+QMDP precomputes the MDP Q-values alpha[a, s] of the fully observable
+maze by value iteration over the tabular models, then plans online with
+one dot product per step: a* = argmax_a alpha_a . b. It ignores the
+value of information (it assumes full observability after one step),
+which is a good fit for this maze where observations are deterministic,
+and it replaces thousands of tree-search simulations per step with an
+O(4 * S) lookup.
+
+The tables (and therefore the planner) use the wall-blocking movement
+semantics of :class:`MazeTables`.
+"""
+
+import numpy as np
+import pomdp_py
+
+from pomdp_py.problems.maze.domain.action import ALL_ACTIONS
+from pomdp_py.problems.maze.models.components.grid_belief import GridHistogram
+from pomdp_py.problems.maze.models.components.tables import MazeTables
+
+
+def solve_qmdp(tables, discount_factor=0.95, tol=1e-6, max_iter=10000):
+    """
+    Value-iterate the tabular maze MDP to convergence.
+
+    Args:
+        tables (MazeTables): precomputed transition/reward tables
+        discount_factor (float): discount per step
+        tol (float): stop when the value change drops below this
+        max_iter (int): iteration cap
+
+    Returns:
+        np.ndarray: (4, S) float64 array of Q-values alpha[a, s]
+    """
+    probs = np.array([tables.main_prob, tables.slip_prob, tables.slip_prob])
+    r_exp = tables.R_exp.astype(np.float64)
+    alphas = np.zeros((4, tables.n_states), dtype=np.float64)
+    goal_states = (np.arange(tables.n_states) >> 2) == tables.goal_cell
+    for _ in range(max_iter):
+        v = alphas.max(axis=0)
+        v[goal_states] = 0.0  # the goal is absorbing
+        # alpha_a = R(a) + gamma * sum_k p_k V(next_k)
+        new = r_exp + discount_factor * (v[tables.T_next] * probs).sum(axis=2)
+        if np.abs(new - alphas).max() < tol:
+            alphas = new
+            break
+        alphas = new
+    return alphas
+
+
+class QMDPPlanner(pomdp_py.Planner):
+    """
+    Plans with precomputed QMDP alpha-vectors; drop-in for POUCT in
+    :func:`pomdp_py.problems.maze.problem.solve`. Unlike the tree-search
+    planners this one updates the agent's belief itself (exactly, via
+    GridHistogram.update_inplace).
+    """
+
+    def __init__(self, maze_map, slip_prob=0.1, discount_factor=0.95, **reward_params):
+        """
+        Args:
+            maze_map (MazeMap): the maze layout
+            slip_prob (float): transition slip probability
+            discount_factor (float): discount used by value iteration
+            reward_params: goal_reward/step_penalty/wall_penalty
+                forwarded to MazeTables
+        """
+        self.tables = MazeTables(maze_map, slip_prob=slip_prob, **reward_params)
+        self.alphas = solve_qmdp(self.tables, discount_factor=discount_factor)
+        self._slip_prob = slip_prob
+
+    @property
+    def updates_agent_belief(self):
+        return True
+
+    def _belief_vector(self, belief):
+        """Belief as a flat (S,) array aligned with the table indices."""
+        if isinstance(belief, GridHistogram):
+            # (H, W, 4) raveled in C order is exactly (y*W + x)*4 + o
+            return belief.probs.ravel()
+        b = np.zeros(self.tables.n_states)
+        for state in belief.get_histogram():
+            b[self.tables.state_index(state)] = belief[state]
+        return b
+
+    def plan(self, agent):
+        b = self._belief_vector(agent.cur_belief)
+        return ALL_ACTIONS[int(np.argmax(self.alphas @ b))]
+
+    def update(self, agent, real_action, real_observation):
+        belief = agent.cur_belief
+        if hasattr(belief, "update_inplace"):
+            # Mutates the belief's buffers; no new belief object per step
+            belief.update_inplace(
+                real_action, real_observation, slip_prob=self._slip_prob
+            )
+        elif isinstance(belief, GridHistogram):
+            agent.set_belief(
+                belief.update(real_action, real_observation, slip_prob=self._slip_prob)
+            )
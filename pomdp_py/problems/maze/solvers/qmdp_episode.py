@@ -0,0 +1,175 @@
+"""
+Whole-episode QMDP driver for the maze domain.
+
+Once the models are tabular, a QMDP episode is just index arithmetic:
+pick argmax_a alpha_a . b, advance the true state through the sampled
+transition table row, read the deterministic observation code, and do
+the exact Bayes update on the flat belief vector. None of that needs a
+Python object per step, so the entire action-feedback loop lives here
+as one free function over the MazeTables arrays. Like the kernels in
+:mod:`pomdp_py.problems.maze.models._kernels` it is written in
+nopython-compatible style and JIT-compiled when numba is installed;
+without numba it runs as-is (S=H*W*4 is small enough that the plain
+loops are still fast).
+
+Tree-search planners cannot take this path — their per-step work is the
+search itself — but for QMDP it removes the remaining per-step Python
+overhead of :func:`pomdp_py.problems.maze.problem.solve`.
+"""
+
+import numpy as np
+
+from pomdp_py.problems.maze.models._kernels import njit
+from pomdp_py.problems.maze.models.components.tables import MazeTables
+from pomdp_py.problems.maze.solvers.qmdp import solve_qmdp
+
+
+@njit(cache=True)
+def run_episode(
+    alphas,
+    T_cdf,
+    T_next,
+    O_code,
+    R,
+    b0,
+    main_prob,
+    slip_prob,
+    goal_cell,
+    start_state,
+    discount_factor,
+    max_steps,
+    seed,
+):
+    """
+    Run one QMDP episode entirely over the table arrays.
+
+    Args:
+        alphas: (4, S) float64 QMDP alpha-vectors from solve_qmdp
+        T_cdf: (4, S, 3) cumulative outcome probabilities (MazeTables)
+        T_next: (4, S, 3) int next-state indices (MazeTables)
+        O_code: (S,) int observation code per state (MazeTables)
+        R: (4, S, 3) reward per outcome (MazeTables)
+        b0: (S,) float64 initial belief; copied, not mutated
+        main_prob, slip_prob: transition probabilities of the tables
+        goal_cell: flat cell index of the goal (absorbing)
+        start_state: flat index of the true initial state
+        discount_factor: discount applied to the returned reward sum
+        max_steps: step cap
+        seed: seeds np.random when >= 0
+
+    Returns:
+        (total_reward, steps): discounted return and steps taken
+    """
+    if seed >= 0:
+        np.random.seed(seed)
+    n_states = b0.shape[0]
+    b = b0.copy()
+    pred = np.zeros(n_states)
+    s = start_state
+    total_reward = 0.0
+    discount = 1.0
+    steps = 0
+    for step in range(max_steps):
+        # Greedy QMDP action: argmax_a alpha_a . b
+        best_a = 0
+        best_v = -1.0e18
+        for a in range(4):
+            v = 0.0
+            for i in range(n_states):
+                v += alphas[a, i] * b[i]
+            if v > best_v:
+                best_v = v
+                best_a = a
+
+        # True transition through the sampled cdf row
+        u = np.random.random()
+        k = 0
+        while k < 2 and u >= T_cdf[best_a, s, k]:
+            k += 1
+        total_reward += discount * R[best_a, s, k]
+        discount *= discount_factor
+        s = T_next[best_a, s, k]
+        steps = step + 1
+        obs = O_code[s]
+
+        # Exact Bayes update: predict through T_next, mask by the
+        # observation code, renormalize
+        for i in range(n_states):
+            pred[i] = 0.0
+        for i in range(n_states):
+            bi = b[i]
+            if bi > 0.0:
+                pred[T_next[best_a, i, 0]] += bi * main_prob
+                pred[T_next[best_a, i, 1]] += bi * slip_prob
+                pred[T_next[best_a, i, 2]] += bi * slip_prob
+        total = 0.0
+        for i in range(n_states):
+            if O_code[i] == obs:
+                total += pred[i]
+            else:
+                pred[i] = 0.0
+        if total <= 0.0:
+            # Observation inconsistent with the predicted belief; fall
+            # back to the observation likelihood alone
+            count = 0
+            for i in range(n_states):
+                if O_code[i] == obs:
+                    count += 1
+            for i in range(n_states):
+                pred[i] = 1.0 / count if O_code[i] == obs else 0.0
+        else:
+            for i in range(n_states):
+                pred[i] /= total
+        b, pred = pred, b
+
+        if (s >> 2) == goal_cell:
+            break
+    return total_reward, steps
+
+
+def run_qmdp_episode(
+    maze_map=None,
+    slip_prob=0.1,
+    discount_factor=0.95,
+    max_steps=50,
+    seed=None,
+    **reward_params,
+):
+    """
+    Build the tables and alpha-vectors for `maze_map` (default: the
+    example maze) and run one episode through :func:`run_episode`. The
+    initial conditions match MazeProblem.create: the true state starts
+    at the maze start facing North, and the belief is uniform over the
+    start-cell orientations.
+
+    Returns:
+        (total_reward, steps)
+    """
+    if maze_map is None:
+        from pomdp_py.problems.maze.models.components.example_maze import EXAMPLE_MAP
+
+        maze_map = EXAMPLE_MAP
+    tables = MazeTables(maze_map, slip_prob=slip_prob, **reward_params)
+    alphas = solve_qmdp(tables, discount_factor=discount_factor)
+
+    b0 = np.zeros(tables.n_states)
+    sx, sy = maze_map.start
+    width = maze_map._wall_mask.shape[1]
+    start_cell = sy * width + sx
+    b0[start_cell * 4 : start_cell * 4 + 4] = 0.25
+
+    return run_episode(
+        alphas,
+        tables.T_cdf,
+        tables.T_next,
+        tables.O_code,
+        tables.R,
+        b0,
+        tables.main_prob,
+        tables.slip_prob,
+        tables.goal_cell,
+        start_cell * 4,
+        discount_factor,
+        max_steps,
+        -1 if seed is None else seed,
+    )
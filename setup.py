@@ -34,6 +34,7 @@ extensions = build_extensions(
         "representations.belief",
         "problems.tiger.cythonize",
         "problems.rocksample.cythonize",
+        "problems.maze.cythonize",
     ],
 )
 